@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import asyncio
 import math
-from typing import Dict, Any
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator, Callable
 
 import numpy as np
+import orjson
 import pandas as pd
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
 
 from crypto_quant.utils.config import set_seed
 from crypto_quant.data.btc_history import load_btc_history
@@ -33,12 +41,38 @@ from crypto_quant.models.lstm_model import lstm_predict_next_prices
 from crypto_quant.models.hmm_regime import fit_hmm_regimes
 from crypto_quant.models.monte_carlo import mc_hit_probability
 from crypto_quant.models.garch_model import fit_garch_and_forecast
-from crypto_quant.risk.risk_metrics import sharpe_ratio, sortino_ratio, max_drawdown, calmar_ratio
+from crypto_quant.risk.risk_metrics import full_risk_metrics
 from crypto_quant.risk.exit_signals import exit_signal
 from crypto_quant.ensemble.meta_learner import blend_forecasts
 
 
-app = FastAPI(title="BTC Quant Forecast API", version="0.1.0")
+class ORJSONResponse(Response):
+    """JSON response rendered by orjson.
+
+    Serializes numpy arrays/scalars natively and int-keyed dicts (horizon
+    maps), so payloads need no ``tolist()`` or key conversion beforehand.
+    NaN/inf are emitted as ``null``.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+    if _MODEL_POOL is not None:
+        _MODEL_POOL.shutdown(cancel_futures=True)
+
+
+app = FastAPI(
+    title="BTC Quant Forecast API",
+    version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
+)
 
 app.add_middleware(
     CORSMiddleware,
@@ -48,6 +82,56 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Model fits are CPU-bound and independent, so they run in worker processes.
+# The pool is created on first use and reused across requests.
+_MODEL_POOL: ProcessPoolExecutor | None = None
+
+
+def _model_pool() -> ProcessPoolExecutor:
+    global _MODEL_POOL
+    if _MODEL_POOL is None:
+        # forkserver: never fork this process while fetch/torch threads are
+        # alive. It is POSIX-only, so use spawn where it is missing (Windows).
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        _MODEL_POOL = ProcessPoolExecutor(
+            max_workers=min(6, os.cpu_count() or 1),
+            mp_context=multiprocessing.get_context(method),
+        )
+    return _MODEL_POOL
+
+
+def _discard_model_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next ``_model_pool()`` call builds a new one."""
+
+    global _MODEL_POOL
+    # a concurrent request may already have replaced it; keep that one
+    if _MODEL_POOL is pool:
+        _MODEL_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _run_model(fn: Callable[..., dict], *args: Any) -> dict:
+    """Run a model in a worker process with a fixed seed.
+
+    The fitted model object is dropped so only plain results are pickled back.
+    """
+
+    set_seed(42)
+    out = fn(*args)
+    if isinstance(out, dict):
+        out.pop("model", None)
+    return out
+
+
+def _as_frame(res: Any) -> pd.DataFrame:
+    return res if isinstance(res, pd.DataFrame) else pd.DataFrame()
+
+
+def _last_value(df: pd.DataFrame, col: str) -> float | None:
+    if col in df.columns and len(df):
+        return float(df[col].iloc[-1])
+    return None
+
 
 def _ensure_close(df: pd.DataFrame) -> pd.DataFrame:
     if "close" not in df.columns and "price" in df.columns:
@@ -62,67 +146,108 @@ def _compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
     close = out["close"]
     high = out.get("high", close)
     low = out.get("low", close)
-    volume = out.get("volume", pd.Series(index=out.index, data=np.nan)).fillna(method="ffill").fillna(0)
+    volume = out.get("volume", pd.Series(np.nan, index=out.index)).ffill().fillna(0.0)
 
-    out = pd.concat([
-        out,
+    # Collect every column first and build the frame once, instead of
+    # concat + repeated inserts that each rebuild the block manager.
+    cols: Dict[str, Any] = dict(out.items())
+    for ind in (
         multi_timeframe_rsi(close),
         macd(close),
         stochastic_oscillator(high, low, close),
         bollinger_bands(close),
-    ], axis=1)
-    out["atr"] = atr(high, low, close)
-    out["roc_12"] = roc(close)
-    out["vwap_dev"] = vwap_deviation(high, low, close, volume)
-    out["fdi_14"] = fractal_dimension_index(close)
-    out["hurst"] = hurst_exponent(close)
-    out["ret"] = np.log(close).diff()
-    out["realized_vol_30"] = realized_volatility(out["ret"])
-    return out
+    ):
+        cols.update(ind.items())
+    cols["atr"] = atr(high, low, close)
+    cols["roc_12"] = roc(close)
+    cols["vwap_dev"] = vwap_deviation(high, low, close, volume)
+    # log(close) feeds fdi, hurst, returns and the LSTM; take it once
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_close = np.log(close.to_numpy(dtype=np.float64))
+    cols["log_close"] = pd.Series(log_close, index=out.index)
+    cols["fdi_14"] = fractal_dimension_index(close, log_series=cols["log_close"])
+    cols["hurst"] = hurst_exponent(close, log_series=cols["log_close"])
+    ret = np.empty_like(log_close)
+    ret[:1] = np.nan
+    ret[1:] = log_close[1:] - log_close[:-1]
+    cols["ret"] = pd.Series(ret, index=out.index)
+    cols["realized_vol_30"] = realized_volatility(cols["ret"])
+    return pd.DataFrame(cols, index=out.index)
 
 
 @app.get("/api/forecast")
-def forecast_endpoint() -> Dict[str, Any]:
+async def forecast_endpoint() -> ORJSONResponse:
     """Run the full pipeline and return JSON results suitable for UI consumption."""
     set_seed(42)
     resp: Dict[str, Any] = {"ok": True}
     try:
-        # Data load + realtime
-        hist = load_btc_history()
+        # Data load + realtime + side data (best-effort), fetched concurrently
+        hist, rt_price, funding, mvrv, nvt, oi, lsr, fng, dxy = await asyncio.gather(
+            asyncio.to_thread(load_btc_history),
+            asyncio.to_thread(fetch_btc_price_coingecko),
+            asyncio.to_thread(fetch_funding_rate),
+            asyncio.to_thread(fetch_mvrv_z_score),
+            asyncio.to_thread(fetch_nvt_ratio),
+            asyncio.to_thread(fetch_open_interest),
+            asyncio.to_thread(fetch_long_short_ratio),
+            asyncio.to_thread(fetch_fear_greed_index),
+            asyncio.to_thread(fetch_dxy_yfinance),
+            return_exceptions=True,
+        )
+        if isinstance(hist, BaseException):
+            raise hist
+        if isinstance(rt_price, BaseException):
+            rt_price = None
+        funding, mvrv, nvt, oi, lsr, fng, dxy = (
+            _as_frame(r) for r in (funding, mvrv, nvt, oi, lsr, fng, dxy)
+        )
+
         hist = _ensure_close(hist)
-        rt_price = fetch_btc_price_coingecko()
         if rt_price and not math.isnan(rt_price):
             last_date = hist["date"].max().normalize()
             today = pd.Timestamp.utcnow().normalize()
             if today > last_date:
-                row = {"date": today, "close": float(rt_price), "price": float(rt_price)}
-                hist = pd.concat([hist, pd.DataFrame([row])], ignore_index=True)
+                # enlarge in place rather than concat a one-row frame
+                hist.loc[len(hist), ["date", "close", "price"]] = [today, float(rt_price), float(rt_price)]
 
         # Indicators + risk
         feats = _compute_indicators(hist)
         close = feats["close"].dropna()
         last_price = float(close.iloc[-1]) if len(close) else float("nan")
-        rets = np.log(close).diff().dropna()
-        risk = {
-            "sharpe": sharpe_ratio(rets),
-            "sortino": sortino_ratio(rets),
-            "max_drawdown": max_drawdown(close),
-            "calmar": calmar_ratio(rets, close),
-        }
-
-        # Side data (best-effort)
-        funding = fetch_funding_rate().tail(1)
+        # feats["ret"] already holds log(close).diff(); only recompute if gaps
+        # in close shift it. NaNs are skipped by the metrics, so no dropna copy.
+        rets = feats["ret"] if len(close) == len(feats) else np.log(close).diff()
+        risk = full_risk_metrics(rets, close)
 
-        # Models
-        arima_fc = fit_arima_forecast(feats)
-        prophet_fc = fit_prophet_forecast(feats)
-        lstm_fc = lstm_predict_next_prices(feats)
-        hmm = fit_hmm_regimes(feats)
-        mc = mc_hit_probability(feats)
-        garch = fit_garch_and_forecast(feats["ret"]) if "ret" in feats.columns else {"model": None, "vol_forecast": np.array([])}
+        # Models (independent, run in parallel worker processes). They only
+        # read date/close (and the LSTM reuses log_close), so ship that slice
+        # instead of every indicator column.
+        loop = asyncio.get_running_loop()
+        model_input = feats[["date", "close", "log_close"]]
+        jobs = (
+            (fit_arima_forecast, model_input),
+            (fit_prophet_forecast, model_input),
+            (lstm_predict_next_prices, model_input),
+            (fit_hmm_regimes, model_input),
+            (mc_hit_probability, model_input),
+            (fit_garch_and_forecast, feats["ret"]),
+        )
+        for attempt in range(2):
+            pool = _model_pool()
+            try:
+                arima_fc, prophet_fc, lstm_fc, hmm, mc, garch = await asyncio.gather(
+                    *(loop.run_in_executor(pool, _run_model, fn, arg) for fn, arg in jobs)
+                )
+                break
+            except BrokenProcessPool:
+                # a worker died (e.g. OOM in the LSTM); the pool is unusable
+                # from now on, so replace it and retry once
+                _discard_model_pool(pool)
+                if attempt:
+                    raise
 
         regime = hmm.get("current_regime", "unknown")
-        latest_funding = float(funding["fundingRate"].iloc[0]) if len(funding) else None
+        latest_funding = _last_value(funding, "fundingRate")
         exit_rec = exit_signal(hist, regime=regime, funding_rate=latest_funding)
 
         forecasts = {
@@ -137,17 +262,26 @@ def forecast_endpoint() -> Dict[str, Any]:
             realtime_price=rt_price,
             risk=risk,
             regime=regime,
-            regime_probs=(hmm.get("probs").tolist() if isinstance(hmm.get("probs"), np.ndarray) else None),
+            regime_probs=hmm.get("probs"),
             forecasts={
                 "arima": arima_fc,
                 "prophet": prophet_fc,
                 "lstm_next_price": lstm_fc.get("next_price"),
-                "garch_vol_forecast": (garch.get("vol_forecast").tolist() if isinstance(garch.get("vol_forecast"), np.ndarray) else None),
+                "garch_vol_forecast": garch.get("vol_forecast"),
             },
             monte_carlo=mc,
             blended=blended,
             exit_signal=exit_rec,
+            side_data={
+                "funding_rate": latest_funding,
+                "mvrv_z_score": _last_value(mvrv, "value"),
+                "nvt_ratio": _last_value(nvt, "value"),
+                "open_interest": _last_value(oi, "openInterest"),
+                "long_short_ratio": _last_value(lsr, "longShortRatio"),
+                "fear_greed": _last_value(fng, "value"),
+                "dxy": _last_value(dxy, "close"),
+            },
         )
     except Exception as e:
         resp.update(ok=False, error=str(e))
-    return resp
+    return ORJSONResponse(resp)
@@ -1,27 +1,45 @@
 # ---------------------------------------
 # Bitcoin Trading Signal + Prediction Tool
 # ---------------------------------------
-# pip install kagglehub[pandas-datasets] pandas numpy requests scikit-learn
+# pip install kagglehub pandas numpy requests
+# optional (faster CSV load and indicators): pip install pyarrow numba bottleneck
+
+import os
 
 import kagglehub
-from kagglehub import KaggleDatasetAdapter
 import pandas as pd
 import numpy as np
 import requests
 from datetime import datetime, timedelta
-from sklearn.linear_model import LinearRegression
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; indicators fall back to pandas
+    njit = None
+
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck is optional; moving averages fall back to pandas
+    bn = None
 
 # ------------------------------
 # 1. LOAD HISTORICAL BTC DATA
 # ------------------------------
 
 file_path = "bitcoin_data.csv"
+local_path = os.path.join(kagglehub.dataset_download("mczielinski/bitcoin-historical-data"), file_path)
+
+# Only Timestamp and Close are used below; skip parsing the other columns.
+try:
+    import pyarrow.csv as pvc
 
-df = kagglehub.load_dataset(
-    KaggleDatasetAdapter.PANDAS,
-    "mczielinski/bitcoin-historical-data",
-    file_path,
-)
+    df = pvc.read_csv(
+        local_path,
+        read_options=pvc.ReadOptions(use_threads=True, block_size=64 << 20),
+        convert_options=pvc.ConvertOptions(include_columns=["Timestamp", "Close"]),
+    ).to_pandas(use_threads=True, self_destruct=True)
+except ImportError:
+    df = pd.read_csv(local_path, usecols=["Timestamp", "Close"])
 
 df["Timestamp"] = pd.to_datetime(df["Timestamp"])
 df = df.sort_values("Timestamp")
@@ -49,20 +67,69 @@ print(f"Current Price (USD): {current_price}")
 # ------------------------------
 
 # Moving averages
-df["MA20"] = df["Price"].rolling(20).mean()
-df["MA50"] = df["Price"].rolling(50).mean()
-df["MA100"] = df["Price"].rolling(100).mean()
-df["MA200"] = df["Price"].rolling(200).mean()
+def moving_average(values, window):
+    if bn is not None:
+        return bn.move_mean(values, window, min_count=window)
+    return pd.Series(values).rolling(window).mean().to_numpy()
+
+price_np = df["Price"].to_numpy(dtype=np.float64)
+for w in (20, 50, 100, 200):
+    df[f"MA{w}"] = moving_average(price_np, w)
 
 # RSI
+if njit is not None:
+    @njit(cache=True)
+    def _rsi_loop(prices, period):
+        # Single pass: running window sums of gains/losses (same simple
+        # rolling-mean RSI as the pandas version below).
+        n = prices.shape[0]
+        out = np.full(n, np.nan)
+        gains = np.zeros(n)
+        losses = np.zeros(n)
+        for i in range(1, n):
+            d = prices[i] - prices[i - 1]
+            if d > 0:
+                gains[i] = d
+            elif d < 0:
+                losses[i] = -d
+        sum_gain = 0.0
+        sum_loss = 0.0
+        n_gain = 0
+        n_loss = 0
+        for i in range(n):
+            sum_gain += gains[i]
+            sum_loss += losses[i]
+            n_gain += gains[i] > 0
+            n_loss += losses[i] > 0
+            if i >= period:
+                sum_gain -= gains[i - period]
+                sum_loss -= losses[i - period]
+                n_gain -= gains[i - period] > 0
+                n_loss -= losses[i - period] > 0
+            # reset drift so windows without moves are exactly zero
+            if n_gain == 0:
+                sum_gain = 0.0
+            if n_loss == 0:
+                sum_loss = 0.0
+            if i >= period - 1:
+                if sum_loss > 0:
+                    out[i] = 100.0 - 100.0 / (1.0 + sum_gain / sum_loss)
+                elif sum_gain > 0:
+                    out[i] = 100.0
+        return out
+
 def compute_RSI(series, period=14):
-    delta = series.diff()
-    gain = delta.where(delta > 0, 0)
-    loss = -delta.where(delta < 0, 0)
-    avg_gain = gain.rolling(period).mean()
-    avg_loss = loss.rolling(period).mean()
-    rs = avg_gain / avg_loss
-    return 100 - (100 / (1 + rs))
+    prices = series.to_numpy(dtype=np.float64)
+    if njit is not None:
+        return pd.Series(_rsi_loop(prices, period), index=series.index)
+    delta = np.diff(prices, prepend=np.nan)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    avg_gain = moving_average(gain, period)
+    avg_loss = moving_average(loss, period)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = 100 - (100 / (1 + avg_gain / avg_loss))
+    return pd.Series(rsi, index=series.index)
 
 df["RSI"] = compute_RSI(df["Price"])
 
@@ -91,34 +158,39 @@ print(f"Volatility: {volatility:.4f}")
 # 4. TRADING SIGNAL (PULL-OUT LOGIC)
 # ------------------------------
 
-def trading_recommendation(row):
-    rsi = row["RSI"]
-    price = row["Price"]
-    ma50 = row["MA50"]
-    ma200 = row["MA200"]
-    macd = row["MACD"]
-    signal = row["Signal"]
-
-    signals = []
-
-    # Overbought
-    if rsi > 70:
-        signals.append("RSI over 70: Market overbought")
-
-    # Downtrend confirmation
-    if price < ma50 < ma200:
-        signals.append("Price below MA50 and MA200: Strong downtrend")
-
-    # MACD bearish crossover
-    if macd < signal:
-        signals.append("MACD below signal: bearish momentum")
+SIGNAL_TEXT = {
+    "Overbought": "RSI over 70: Market overbought",
+    "Downtrend": "Price below MA50 and MA200: Strong downtrend",
+    "MACDBear": "MACD below signal: bearish momentum",
+}
+
+def trading_signals(frame):
+    # Evaluate every pull-out condition for all rows at once (NaN compares False).
+    price = frame["Price"].to_numpy()
+    ma50 = frame["MA50"].to_numpy()
+    ma200 = frame["MA200"].to_numpy()
+    return pd.DataFrame(
+        {
+            "Overbought": frame["RSI"].to_numpy() > 70,
+            "Downtrend": (price < ma50) & (ma50 < ma200),
+            "MACDBear": frame["MACD"].to_numpy() < frame["Signal"].to_numpy(),
+        },
+        index=frame.index,
+    )
+
+def trading_recommendation(flags):
+    signals = [text for name, text in SIGNAL_TEXT.items() if flags[name]]
 
     if len(signals) == 0:
         return "No major pull-out signals right now"
     else:
         return "Potential exit signals:\n" + "\n".join(signals)
 
-rec = trading_recommendation(latest)
+flags = trading_signals(df)
+df[list(flags.columns)] = flags
+df["ExitSignals"] = flags.to_numpy().sum(axis=1)
+
+rec = trading_recommendation(flags.iloc[-1])
 
 print("\n===== Practical Trading Recommendation =====")
 print(rec)
@@ -132,14 +204,14 @@ df["LogPrice"] = np.log(df["Price"])
 df["Days"] = (df["Timestamp"] - df["Timestamp"].iloc[0]).dt.days
 
 valid = df.dropna(subset=["LogPrice", "Days"])
-X = valid["Days"].values.reshape(-1, 1)
-y = valid["LogPrice"].values
-
-model = LinearRegression()
-model.fit(X, y)
-
-slope = model.coef_[0]
-intercept = model.intercept_
+days = valid["Days"].to_numpy(dtype=np.float64)
+log_price = valid["LogPrice"].to_numpy(dtype=np.float64)
+
+# Single-feature OLS in closed form: slope = cov(x, y) / var(x)
+d_centered = days - days.mean()
+lp_mean = log_price.mean()
+slope = (d_centered * (log_price - lp_mean)).sum() / (d_centered * d_centered).sum()
+intercept = lp_mean - slope * days.mean()
 log_target = np.log(TARGET)
 
 if slope <= 0:
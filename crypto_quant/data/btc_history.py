@@ -3,6 +3,8 @@ from __future__ import annotations
 
 import os
 import io
+import time
+import hashlib
 import zipfile
 import datetime as dt
 from typing import Optional
@@ -11,6 +13,48 @@ from urllib.request import urlopen
 import numpy as np
 import pandas as pd
 
+from ..utils.cache import CACHE_DIR
+
+
+# Raw column names _normalize_daily knows how to use; everything else is skipped at parse time.
+_KNOWN_COLUMNS = {"date", "timestamp", "time", "open", "high", "low", "close", "volume", "volume usd", "price"}
+_NUMERIC_COLUMNS = {"open", "high", "low", "close", "volume", "volume usd", "price"}
+
+
+def _read_csv(path: str) -> pd.DataFrame:
+    """Read only the columns needed for normalization from a (possibly large) CSV.
+
+    Uses pyarrow's multithreaded reader with column pushdown when available,
+    falling back to pandas with ``usecols``.
+
+    Args:
+        path (str): CSV file path.
+
+    Returns:
+        pd.DataFrame: Raw DataFrame restricted to known columns.
+    """
+
+    # utf-8-sig drops the BOM Excel exports start with, which would otherwise
+    # stick to the first column name and filter the date column out
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+        header = [c.strip().strip('"') for c in f.readline().rstrip("\r\n").split(",")]
+    cols = [c for c in header if c.lower() in _KNOWN_COLUMNS] or header
+    try:
+        import pyarrow as pa  # type: ignore
+        import pyarrow.csv as pvc  # type: ignore
+
+        table = pvc.read_csv(
+            path,
+            read_options=pvc.ReadOptions(use_threads=True, block_size=64 << 20),
+            convert_options=pvc.ConvertOptions(
+                include_columns=cols,
+                column_types={c: pa.float64() for c in cols if c.lower() in _NUMERIC_COLUMNS},
+            ),
+        )
+        return table.to_pandas(use_threads=True, self_destruct=True)
+    except ImportError:
+        return pd.read_csv(path, usecols=cols)
+
 
 def _try_kaggle_daily() -> Optional[pd.DataFrame]:
     """Attempt to load a daily BTC dataset via kagglehub.
@@ -21,27 +65,32 @@ def _try_kaggle_daily() -> Optional[pd.DataFrame]:
 
     try:
         import kagglehub  # type: ignore
+    except ImportError:
+        return None
 
-        # Use a lightweight daily dataset if available
-        # Example: 'mczielinski/bitcoin-historical-data' contains minute bars; heavy to load.
-        # Instead, try a daily dataset. If not found, fall through to fallback.
-        # We'll try CoinDesk daily OHLC (often mirrored), else skip.
-        # Note: kagglehub.fetch returns a local path after download.
-        candidates = [
-            # (dataset, relative path inside archive)
-            ("mczielinski/bitcoin-historical-data", "coinbaseUSD_1-dag_data.csv"),
-        ]
-        for ds, rel in candidates:
-            try:
-                local_dir = kagglehub.dataset_download(ds)
-                candidate_path = os.path.join(local_dir, rel)
-                if os.path.exists(candidate_path):
-                    df = pd.read_csv(candidate_path)
-                    return _normalize_daily(df)
-            except Exception:
-                continue
-    except Exception:
-        pass
+    # Use a lightweight daily dataset if available
+    # Example: 'mczielinski/bitcoin-historical-data' contains minute bars; heavy to load.
+    # Instead, try a daily dataset. If not found, fall through to fallback.
+    # We'll try CoinDesk daily OHLC (often mirrored), else skip.
+    # Note: kagglehub.fetch returns a local path after download.
+    candidates = [
+        # (dataset, relative path inside archive)
+        ("mczielinski/bitcoin-historical-data", "coinbaseUSD_1-dag_data.csv"),
+    ]
+    for ds, rel in candidates:
+        try:
+            local_dir = kagglehub.dataset_download(ds)
+        except Exception:
+            # network/auth failures are expected here; try the next candidate
+            continue
+        candidate_path = os.path.join(local_dir, rel)
+        if not os.path.exists(candidate_path):
+            continue
+        try:
+            return _normalize_daily(_read_csv(candidate_path))
+        except (OSError, ValueError, KeyError):
+            # unreadable or unrecognized layout (pandas/pyarrow parse errors are ValueErrors)
+            continue
     return None
 
 
@@ -69,18 +118,20 @@ def _normalize_daily(df: pd.DataFrame) -> pd.DataFrame:
         "Volume USD": "volume",
     }
     df = df.rename(columns=rename_map)
+    # lowercase -> original name, first occurrence wins
+    cols_lower = {c.lower(): c for c in reversed(df.columns)}
     if "date" not in df.columns:
         # attempt converting UNIX timestamp column
-        for c in df.columns:
-            if c.lower() in ("timestamp", "time"):
-                df["date"] = pd.to_datetime(df[c], unit="s", utc=True)
-                break
+        ts_col = cols_lower.get("timestamp") or cols_lower.get("time")
+        if ts_col is not None:
+            df["date"] = pd.to_datetime(df[ts_col], unit="s", utc=True)
     if "date" not in df.columns:
         raise ValueError("No date column found after normalization")
 
     df["date"] = pd.to_datetime(df["date"], errors="coerce", utc=True)
     for c in ["open", "high", "low", "close", "volume"]:
-        if c in df.columns:
+        # typed readers (pyarrow, yfinance) already deliver float64
+        if c in df.columns and not pd.api.types.is_numeric_dtype(df[c]):
             df[c] = pd.to_numeric(df[c], errors="coerce")
     # price alias
     if "close" in df.columns:
@@ -89,10 +140,8 @@ def _normalize_daily(df: pd.DataFrame) -> pd.DataFrame:
         df["price"] = df["open"]
     else:
         # if only a Price column exists
-        for c in df.columns:
-            if c.lower() == "price":
-                df["price"] = pd.to_numeric(df[c], errors="coerce")
-                break
+        if "price" in cols_lower:
+            df["price"] = pd.to_numeric(df[cols_lower["price"]], errors="coerce")
     df = df.sort_values("date").dropna(subset=["date", "price"]).reset_index(drop=True)
     return df[[c for c in ["date", "open", "high", "low", "close", "volume", "price"] if c in df.columns]]
 
@@ -126,10 +175,49 @@ def _fallback_yfinance(period: str = "max") -> pd.DataFrame:
     return hist[["date", "open", "high", "low", "close", "volume", "price"]]
 
 
+_SNAPSHOT_TTL = 86_400  # seconds; daily bars only change once a day
+
+
+def _snapshot_path(source: str) -> str:
+    tag = hashlib.sha1(source.encode("utf-8")).hexdigest()[:12]
+    return os.path.join(CACHE_DIR, f"btc_hist_{tag}.parquet")
+
+
+def _read_snapshot(path: str, source_path: Optional[str] = None) -> Optional[pd.DataFrame]:
+    """Return the parquet snapshot if it is fresh, non-empty and newer than its source file."""
+
+    try:
+        mtime = os.path.getmtime(path)
+        if time.time() - mtime >= _SNAPSHOT_TTL:
+            return None
+        if source_path and os.path.getmtime(source_path) > mtime:
+            return None
+        df = pd.read_parquet(path)
+    except Exception:
+        return None
+    return None if df.empty else df
+
+
+def _write_snapshot(path: str, df: pd.DataFrame) -> None:
+    # An empty frame is a failed fetch (e.g. a rate-limited yfinance call);
+    # snapshotting it would pin the failure for the whole TTL.
+    if df.empty:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        df.to_parquet(tmp, compression="zstd", index=False)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
 def load_btc_history() -> pd.DataFrame:
     """Load full BTC historical daily dataset.
 
     Tries Kaggle via kagglehub, then CSV path set in BTC_HIST_CSV env var, then yfinance.
+    The normalized result is snapshotted to parquet and reused for a day (or
+    until the BTC_HIST_CSV file changes).
 
     Returns:
         pd.DataFrame: Daily BTC data with 'date' and 'price' at minimum.
@@ -138,19 +226,29 @@ def load_btc_history() -> pd.DataFrame:
     # 1) Environment CSV path
     csv_path = os.getenv("BTC_HIST_CSV")
     if csv_path and os.path.exists(csv_path):
+        snapshot = _snapshot_path(os.path.abspath(csv_path))
+        cached = _read_snapshot(snapshot, csv_path)
+        if cached is not None:
+            return cached
         try:
-            df = pd.read_csv(csv_path)
-            return _normalize_daily(df)
+            df = _normalize_daily(_read_csv(csv_path))
+            _write_snapshot(snapshot, df)
+            return df
         except Exception:
             pass
 
-    # 2) Kaggle attempt
-    kaggle_df = _try_kaggle_daily()
-    if kaggle_df is not None:
-        return kaggle_df
+    snapshot = _snapshot_path("remote")
+    cached = _read_snapshot(snapshot)
+    if cached is not None:
+        return cached
 
+    # 2) Kaggle attempt
+    df = _try_kaggle_daily()
     # 3) yfinance fallback
-    return _fallback_yfinance()
+    if df is None:
+        df = _fallback_yfinance()
+    _write_snapshot(snapshot, df)
+    return df
 
 
 def last_3_months(df: pd.DataFrame) -> pd.DataFrame:
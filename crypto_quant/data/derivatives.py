@@ -1,13 +1,15 @@
 """Derivatives market data from Binance public endpoints."""
 from __future__ import annotations
 
-import json
 from typing import Optional
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
+import numpy as np
 import pandas as pd
 
+from ..utils.cache import cached
+from ..utils.http import get_json
+
 
 _BINANCE_FAPI = "https://fapi.binance.com"
 _BINANCE_API = "https://api.binance.com"
@@ -15,13 +17,29 @@ _BINANCE_API = "https://api.binance.com"
 
 def _get_json(url: str) -> Optional[dict | list]:
     try:
-        req = Request(url, headers={"User-Agent": "crypto-quant/1.0"})
-        with urlopen(req, timeout=15) as resp:
-            return json.loads(resp.read().decode("utf-8"))
+        return get_json(url, timeout=15)
     except Exception:
         return None
 
 
+def _series_frame(data: list, time_key: str, value_key: str, value_name: str) -> pd.DataFrame:
+    """Build a ['date', value_name] frame column-wise from a Binance record list.
+
+    Pulling the two fields straight into typed arrays avoids pandas inspecting
+    every record dict to infer a schema. Malformed payloads yield an empty frame.
+    """
+
+    n = len(data)
+    try:
+        times = np.fromiter((int(d[time_key]) for d in data), dtype=np.int64, count=n)
+        vals = np.fromiter((float(d[value_key]) for d in data), dtype=np.float64, count=n)
+    except (KeyError, TypeError, ValueError):
+        return pd.DataFrame(columns=["date", value_name])
+    df = pd.DataFrame({"date": pd.to_datetime(times, unit="ms", utc=True), value_name: vals})
+    return df.dropna(subset=[value_name]).sort_values("date").reset_index(drop=True)
+
+
+@cached(ttl=3600)
 def fetch_funding_rate(symbol: str = "BTCUSDT", limit: int = 1000) -> pd.DataFrame:
     """Fetch historical funding rates (futures) from Binance.
 
@@ -38,13 +56,10 @@ def fetch_funding_rate(symbol: str = "BTCUSDT", limit: int = 1000) -> pd.DataFra
     data = _get_json(url)
     if not isinstance(data, list):
         return pd.DataFrame(columns=["date", "fundingRate"])
-    df = pd.DataFrame(data)
-    if "fundingRate" in df.columns:
-        df["fundingRate"] = pd.to_numeric(df["fundingRate"], errors="coerce")
-    df["date"] = pd.to_datetime(df["fundingTime"], unit="ms", utc=True)
-    return df.dropna(subset=["date", "fundingRate"])[["date", "fundingRate"]].sort_values("date").reset_index(drop=True)
+    return _series_frame(data, "fundingTime", "fundingRate", "fundingRate")
 
 
+@cached(ttl=3600)
 def fetch_open_interest(symbol: str = "BTCUSDT", interval: str = "1d", limit: int = 200) -> pd.DataFrame:
     """Fetch open interest historical data from Binance futures.
 
@@ -62,12 +77,10 @@ def fetch_open_interest(symbol: str = "BTCUSDT", interval: str = "1d", limit: in
     data = _get_json(url)
     if not isinstance(data, list):
         return pd.DataFrame(columns=["date", "openInterest"])
-    df = pd.DataFrame(data)
-    df["date"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-    df["openInterest"] = pd.to_numeric(df["sumOpenInterest"], errors="coerce")
-    return df.dropna(subset=["date", "openInterest"])[["date", "openInterest"]].sort_values("date").reset_index(drop=True)
+    return _series_frame(data, "timestamp", "sumOpenInterest", "openInterest")
 
 
+@cached(ttl=3600)
 def fetch_long_short_ratio(symbol: str = "BTCUSDT", period: str = "1d", limit: int = 200) -> pd.DataFrame:
     """Fetch top trader long/short ratio from Binance futures.
 
@@ -85,10 +98,7 @@ def fetch_long_short_ratio(symbol: str = "BTCUSDT", period: str = "1d", limit: i
     data = _get_json(url)
     if not isinstance(data, list):
         return pd.DataFrame(columns=["date", "longShortRatio"])
-    df = pd.DataFrame(data)
-    df["date"] = pd.to_datetime(df["timestamp"], unit="ms", utc=True)
-    df["longShortRatio"] = pd.to_numeric(df["longShortRatio"], errors="coerce")
-    return df.dropna(subset=["date", "longShortRatio"])[["date", "longShortRatio"]].sort_values("date").reset_index(drop=True)
+    return _series_frame(data, "timestamp", "longShortRatio", "longShortRatio")
 
 
 def fetch_options_iv_placeholder() -> pd.DataFrame:
@@ -1,17 +1,20 @@
 """Macro data such as DXY, SP500 correlation, and US interest rates."""
 from __future__ import annotations
 
-import json
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from typing import Optional
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
 import numpy as np
 import pandas as pd
 
+from ..utils.cache import cached
 from ..utils.config import get_api_keys
+from ..utils.http import get_json
 
 
+@cached(ttl=3600)
 def fetch_dxy_yfinance(period: str = "5y") -> pd.DataFrame:
     """Fetch DXY index via yfinance.
 
@@ -35,6 +38,26 @@ def fetch_dxy_yfinance(period: str = "5y") -> pd.DataFrame:
         return pd.DataFrame(columns=["date", "close"])
 
 
+@cached(ttl=3600)
+def _fetch_sp500_history(period: str = "2y") -> pd.DataFrame:
+    """Fetch S&P 500 daily closes via yfinance.
+
+    Returns:
+        pd.DataFrame: ['date','sp_close'] or empty DataFrame.
+    """
+
+    try:
+        import yfinance as yf
+
+        sp = yf.Ticker("^GSPC")
+        sp_hist = sp.history(period=period, interval="1d").reset_index()
+        sp_hist = sp_hist.rename(columns={"Date": "date", "Close": "sp_close"})
+        sp_hist["date"] = pd.to_datetime(sp_hist["date"], utc=True)
+        return sp_hist[["date", "sp_close"]]
+    except Exception:
+        return pd.DataFrame(columns=["date", "sp_close"])
+
+
 def sp500_correlation_with_btc(btc_df: pd.DataFrame, lookback: int = 90) -> float:
     """Compute correlation between BTC daily returns and S&P 500 daily returns.
 
@@ -47,27 +70,47 @@ def sp500_correlation_with_btc(btc_df: pd.DataFrame, lookback: int = 90) -> floa
     """
 
     try:
-        import yfinance as yf
-
-        sp = yf.Ticker("^GSPC")
-        sp_hist = sp.history(period="2y", interval="1d").reset_index()
-        sp_hist = sp_hist.rename(columns={"Date": "date", "Close": "sp_close"})
-        sp_hist["date"] = pd.to_datetime(sp_hist["date"], utc=True)
-        b = btc_df.copy()
-        if "close" not in b.columns and "price" in b.columns:
-            b["close"] = b["price"]
-        b = b[["date", "close"]]
-        merged = pd.merge_asof(
-            b.sort_values("date"), sp_hist.sort_values("date"), on="date"
-        ).dropna()
-        merged["btc_ret"] = merged["close"].pct_change()
-        merged["sp_ret"] = merged["sp_close"].pct_change()
-        tail = merged.tail(lookback)
-        return float(tail[["btc_ret", "sp_ret"]].corr().iloc[0, 1])
+        sp_hist = _fetch_sp500_history()
+        if sp_hist.empty:
+            return float("nan")
+        col = "price" if "close" not in btc_df.columns and "price" in btc_df.columns else "close"
+        b = btc_df[["date", col]].dropna().sort_values("date")
+        # As-of align: each BTC date takes the latest S&P close at or before it.
+        sp = sp_hist.set_index("date")["sp_close"].sort_index()
+        sp_px = sp.reindex(pd.DatetimeIndex(b["date"]), method="ffill").to_numpy(dtype=float)
+        btc_px = b[col].to_numpy(dtype=float)
+        valid = ~np.isnan(sp_px)
+        btc_px = btc_px[valid][-(lookback + 1):]
+        sp_px = sp_px[valid][-(lookback + 1):]
+        if len(btc_px) < 3:
+            return float("nan")
+        btc_ret = btc_px[1:] / btc_px[:-1] - 1.0
+        sp_ret = sp_px[1:] / sp_px[:-1] - 1.0
+        return float(np.corrcoef(btc_ret, sp_ret)[0, 1])
     except Exception:
         return float("nan")
 
 
+def _fetch_fred_series(name: str, series_id: str, api_key: str) -> pd.DataFrame:
+    """Fetch one FRED series as ['date', name]."""
+
+    q = urlencode(
+        {
+            "series_id": series_id,
+            "api_key": api_key,
+            "file_type": "json",
+            "observation_start": "2000-01-01",
+        }
+    )
+    url = f"https://api.stlouisfed.org/fred/series/observations?{q}"
+    data = get_json(url, timeout=20)
+    obs = pd.DataFrame(data.get("observations", []))[["date", "value"]]
+    obs["date"] = pd.to_datetime(obs["date"], utc=True)
+    obs[name] = pd.to_numeric(obs["value"], errors="coerce")
+    return obs[["date", name]]
+
+
+@cached(ttl=3600)
 def fetch_fred_interest_rates() -> pd.DataFrame:
     """Fetch US interest rates (2Y, 10Y) from FRED if API key exists.
 
@@ -80,24 +123,9 @@ def fetch_fred_interest_rates() -> pd.DataFrame:
         return pd.DataFrame(columns=["date", "DGS2", "DGS10"])
     try:
         series = {"DGS2": "DGS2", "DGS10": "DGS10"}
-        frames = []
-        for name, sid in series.items():
-            q = urlencode(
-                {
-                    "series_id": sid,
-                    "api_key": keys.fred,
-                    "file_type": "json",
-                    "observation_start": "2000-01-01",
-                }
-            )
-            url = f"https://api.stlouisfed.org/fred/series/observations?{q}"
-            req = Request(url, headers={"User-Agent": "crypto-quant/1.0"})
-            with urlopen(req, timeout=20) as resp:
-                data = json.loads(resp.read().decode("utf-8"))
-            obs = pd.DataFrame(data.get("observations", []))[["date", "value"]]
-            obs["date"] = pd.to_datetime(obs["date"], utc=True)
-            obs[name] = pd.to_numeric(obs["value"], errors="coerce")
-            frames.append(obs[["date", name]])
+        # Series are independent; fetch them concurrently over the shared session.
+        with ThreadPoolExecutor(max_workers=len(series)) as ex:
+            frames = list(ex.map(_fetch_fred_series, series.keys(), series.values(), repeat(keys.fred)))
         out = frames[0]
         for f in frames[1:]:
             out = pd.merge(out, f, on="date", how="outer")
@@ -1,14 +1,14 @@
 """On-chain metrics via Glassnode where possible."""
 from __future__ import annotations
 
-import json
 from typing import Optional
 from urllib.parse import urlencode
-from urllib.request import Request, urlopen
 
 import pandas as pd
 
+from ..utils.cache import cached
 from ..utils.config import get_api_keys
+from ..utils.http import get_json
 
 
 def _glassnode_fetch(metric: str, params: dict) -> Optional[pd.DataFrame]:
@@ -25,35 +25,56 @@ def _glassnode_fetch(metric: str, params: dict) -> Optional[pd.DataFrame]:
     keys = get_api_keys()
     if not keys.glassnode:
         return None
+    base = f"https://api.glassnode.com/v1/metrics/indicators/{metric}"
+    q = params.copy()
+    q["api_key"] = keys.glassnode
+    url = f"{base}?{urlencode(q)}"
     try:
-        base = f"https://api.glassnode.com/v1/metrics/indicators/{metric}"
-        q = params.copy()
-        q["api_key"] = keys.glassnode
-        url = f"{base}?{urlencode(q)}"
-        req = Request(url, headers={"User-Agent": "crypto-quant/1.0"})
-        with urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
-        df = pd.DataFrame(data)
-        if "t" in df.columns:
-            df["date"] = pd.to_datetime(df["t"], unit="s", utc=True)
-        elif "time" in df.columns:
-            df["date"] = pd.to_datetime(df["time"], unit="s", utc=True)
-        else:
-            # Some endpoints may deliver 'timestamp'
-            for c in df.columns:
-                if c.lower() in ("timestamp", "ts"):
-                    df["date"] = pd.to_datetime(df[c], unit="s", utc=True)
-                    break
-        if "v" in df.columns:
-            df["value"] = pd.to_numeric(df["v"], errors="coerce")
-        elif "value" not in df.columns and "o" in df.columns:
-            df["value"] = pd.to_numeric(df["o"], errors="coerce")
-        df = df.dropna(subset=["date", "value"]).sort_values("date").reset_index(drop=True)
-        return df[["date", "value"]]
+        data = get_json(url, timeout=15)
     except Exception:
         return None
+    # Series endpoints return a list of records; anything else is an error payload.
+    if not isinstance(data, list) or not data:
+        return None
+
+    try:
+        df = pd.DataFrame(data)
+    except (TypeError, ValueError):
+        return None
+    # columns are ints for list-of-scalars payloads, so don't assume strings
+    cols_lower = {str(c).lower(): c for c in reversed(df.columns)}
+    if "t" in df.columns:
+        ts_col = "t"
+    elif "time" in df.columns:
+        ts_col = "time"
+    else:
+        # Some endpoints may deliver 'timestamp'
+        ts_col = cols_lower.get("timestamp") or cols_lower.get("ts")
+    if "v" in df.columns:
+        val_col = "v"
+    elif "value" in df.columns:
+        val_col = "value"
+    else:
+        val_col = "o" if "o" in df.columns else None
+    if ts_col is None or val_col is None:
+        return None
+
+    # null or non-numeric timestamps become NaT and are dropped below;
+    # out-of-range epochs still raise, and the fetch is best-effort
+    try:
+        ts = pd.to_numeric(df[ts_col], errors="coerce")
+        out = pd.DataFrame(
+            {
+                "date": pd.to_datetime(ts, unit="s", utc=True, errors="coerce"),
+                "value": pd.to_numeric(df[val_col], errors="coerce"),
+            }
+        )
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return out.dropna(subset=["date", "value"]).sort_values("date").reset_index(drop=True)
 
 
+@cached(ttl=3600)
 def fetch_mvrv_z_score() -> pd.DataFrame:
     """Fetch Glassnode MVRV Z-score for BTC if possible.
 
@@ -65,6 +86,7 @@ def fetch_mvrv_z_score() -> pd.DataFrame:
     return df if df is not None else pd.DataFrame(columns=["date", "value"])
 
 
+@cached(ttl=3600)
 def fetch_nvt_ratio() -> pd.DataFrame:
     """Fetch Glassnode NVT ratio for BTC if possible.
 
@@ -1,9 +1,9 @@
 """Realtime market data utilities."""
 from __future__ import annotations
 
-import json
 from typing import Optional
-from urllib.request import urlopen, Request
+
+from ..utils.http import get_json
 
 
 def fetch_btc_price_coingecko() -> Optional[float]:
@@ -17,9 +17,7 @@ def fetch_btc_price_coingecko() -> Optional[float]:
         url = (
             "https://api.coingecko.com/api/v3/simple/price?ids=bitcoin&vs_currencies=usd"
         )
-        req = Request(url, headers={"User-Agent": "crypto-quant/1.0"})
-        with urlopen(req, timeout=10) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+        data = get_json(url, timeout=10)
         return float(data.get("bitcoin", {}).get("usd"))
     except Exception:
         return None
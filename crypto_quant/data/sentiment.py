@@ -1,13 +1,15 @@
 """Sentiment data sources and placeholders."""
 from __future__ import annotations
 
-import json
 from typing import Optional
-from urllib.request import Request, urlopen
 
 import pandas as pd
 
+from ..utils.cache import cached
+from ..utils.http import get_json
 
+
+@cached(ttl=3600)
 def fetch_fear_greed_index() -> pd.DataFrame:
     """Fetch Crypto Fear & Greed Index from alternative.me.
 
@@ -17,14 +19,12 @@ def fetch_fear_greed_index() -> pd.DataFrame:
 
     try:
         url = "https://api.alternative.me/fng/?limit=0&format=json"
-        req = Request(url, headers={"User-Agent": "crypto-quant/1.0"})
-        with urlopen(req, timeout=15) as resp:
-            data = json.loads(resp.read().decode("utf-8"))
+        data = get_json(url, timeout=15)
         values = data.get("data", [])
-        df = pd.DataFrame(values)
+        df = pd.DataFrame.from_records(values, columns=["timestamp", "value", "value_classification"])
+        df = df.astype({"timestamp": "int64", "value": "float64"}, copy=False)
         df["date"] = pd.to_datetime(df["timestamp"], unit="s", utc=True)
-        df["value"] = pd.to_numeric(df["value"], errors="coerce")
-        df["classification"] = df.get("value_classification", "")
+        df["classification"] = df["value_classification"].fillna("")
         return df.dropna(subset=["date", "value"])[["date", "value", "classification"]].sort_values("date").reset_index(drop=True)
     except Exception:
         return pd.DataFrame(columns=["date", "value", "classification"])
@@ -56,44 +56,36 @@ def blend_forecasts(
     """
 
     df = _normalize_forecasts(forecasts, last_price)
+    columns = df.columns.tolist()
 
     # Determine base weights
     if backtest_errors and len(backtest_errors) > 0:
         # inverse MAE weighting
-        inv = {m: 1.0 / e if e and np.isfinite(e) and e > 0 else 0.0 for m, e in backtest_errors.items()}
-        tot = sum(inv.values()) or 1.0
-        w = {m: v / tot for m, v in inv.items()}
-        # If some models missing in errors, distribute small uniform weight
-        for m in df.columns:
-            if m not in w:
-                w[m] = 0.0
+        w_src = {m: 1.0 / e if e and np.isfinite(e) and e > 0 else 0.0 for m, e in backtest_errors.items()}
     else:
-        w = _regime_weights(regime)
-        # ensure all columns present
-        for m in df.columns:
-            w.setdefault(m, 0.0)
-        # normalize
-        s = sum(w.values()) or 1.0
-        w = {k: v / s for k, v in w.items()}
-
-    w_vec = np.array([w.get(c, 0.0) for c in df.columns])
+        w_src = _regime_weights(regime)
+    # Models without a weight get 0. The total spans every weighted model, so
+    # weight of a model that produced no forecast is not redistributed.
+    w_vec = np.fromiter((w_src.get(c, 0.0) for c in columns), dtype=np.float64, count=len(columns))
+    w_vec /= sum(w_src.values()) or 1.0
     blended_by_day = df.values @ w_vec
+    idx_map = {h: i for i, h in enumerate(df.index)}
 
     # Map horizons to required outputs
     result: Dict[str, float] = {}
     # 1d
-    if 1 in df.index:
-        result["1d"] = float(blended_by_day[list(df.index).index(1)])
+    if 1 in idx_map:
+        result["1d"] = float(blended_by_day[idx_map[1]])
     else:
         result["1d"] = float(last_price)
     # 1w (7d)
-    if 7 in df.index:
-        result["1w"] = float(blended_by_day[list(df.index).index(7)])
+    if 7 in idx_map:
+        result["1w"] = float(blended_by_day[idx_map[7]])
     else:
         result["1w"] = float(result["1d"])  # fallback
     # 1m (30d)
-    if 30 in df.index:
-        result["1m"] = float(blended_by_day[list(df.index).index(30)])
+    if 30 in idx_map:
+        result["1m"] = float(blended_by_day[idx_map[30]])
     else:
         result["1m"] = float(result["1w"])
     # 1h: scale from 1d assuming 24h scaling of expected change
@@ -4,6 +4,8 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from ..utils._njit import NUMBA_AVAILABLE, njit
+
 
 def ema(series: pd.Series, span: int) -> pd.Series:
     """Exponential moving average.
@@ -16,7 +18,41 @@ def ema(series: pd.Series, span: int) -> pd.Series:
         pd.Series: EMA.
     """
 
-    return series.ewm(span=span, adjust=False).mean()
+    if not NUMBA_AVAILABLE:
+        return series.ewm(span=span, adjust=False).mean()
+    x = series.to_numpy(dtype=np.float64)
+    return pd.Series(_ewma(x, (span - 1) / 2.0, 1), index=series.index, name=series.name)
+
+
+@njit(cache=True)
+def _ewma(x: np.ndarray, com: float, min_periods: int) -> np.ndarray:
+    # Same recurrence as pandas' ewm(com=com, adjust=False).mean(), NaN
+    # handling included, so results match the cython path bit for bit.
+    n = x.shape[0]
+    out = np.empty(n)
+    if n == 0:
+        return out
+    alpha = 1.0 / (1.0 + com)
+    old_wt_factor = 1.0 - alpha
+    weighted = x[0]
+    nobs = 0 if np.isnan(weighted) else 1
+    out[0] = weighted if nobs >= min_periods else np.nan
+    old_wt = 1.0
+    for i in range(1, n):
+        cur = x[i]
+        is_obs = not np.isnan(cur)
+        if is_obs:
+            nobs += 1
+        if not np.isnan(weighted):
+            old_wt *= old_wt_factor
+            if is_obs:
+                if weighted != cur:
+                    weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+                old_wt = 1.0
+        elif is_obs:
+            weighted = cur
+        out[i] = weighted if nobs >= min_periods else np.nan
+    return out
 
 
 def rsi(series: pd.Series, period: int = 14) -> pd.Series:
@@ -30,6 +66,8 @@ def rsi(series: pd.Series, period: int = 14) -> pd.Series:
         pd.Series: RSI values (0-100).
     """
 
+    if NUMBA_AVAILABLE:
+        return pd.Series(_rsi_kernel(series.to_numpy(dtype=np.float64), period), index=series.index, name=series.name)
     delta = series.diff()
     gain = delta.clip(lower=0)
     loss = -delta.clip(upper=0)
@@ -40,6 +78,50 @@ def rsi(series: pd.Series, period: int = 14) -> pd.Series:
     return rsi_val.fillna(50.0)
 
 
+@njit(cache=True)
+def _rsi_kernel(x: np.ndarray, period: int) -> np.ndarray:
+    # Single pass over the price array: diff, gain/loss split and both Wilder
+    # EWMAs (pandas adjust=False recurrence, min_periods=period) in registers.
+    n = x.shape[0]
+    out = np.empty(n)
+    a = 1.0 / period
+    alpha = 1.0 / (1.0 + (1.0 - a) / a)
+    decay = 1.0 - alpha
+    avg_gain = np.nan
+    avg_loss = np.nan
+    wt_gain = 1.0
+    wt_loss = 1.0
+    nobs = 0
+    for i in range(n):
+        delta = x[i] - x[i - 1] if i > 0 else np.nan
+        is_obs = not np.isnan(delta)
+        gain = max(delta, 0.0) if is_obs else np.nan
+        loss = -min(delta, 0.0) if is_obs else np.nan
+        if is_obs:
+            nobs += 1
+        if not np.isnan(avg_gain):
+            wt_gain *= decay
+            if is_obs:
+                if avg_gain != gain:
+                    avg_gain = (wt_gain * avg_gain + alpha * gain) / (wt_gain + alpha)
+                wt_gain = 1.0
+        elif is_obs:
+            avg_gain = gain
+        if not np.isnan(avg_loss):
+            wt_loss *= decay
+            if is_obs:
+                if avg_loss != loss:
+                    avg_loss = (wt_loss * avg_loss + alpha * loss) / (wt_loss + alpha)
+                wt_loss = 1.0
+        elif is_obs:
+            avg_loss = loss
+        if nobs < period or np.isnan(avg_gain) or np.isnan(avg_loss) or avg_loss == 0:
+            out[i] = 50.0
+        else:
+            out[i] = 100 - (100 / (1 + avg_gain / avg_loss))
+    return out
+
+
 def multi_timeframe_rsi(series: pd.Series, periods: list[int] = [14, 30, 50]) -> pd.DataFrame:
     """Compute RSI for multiple lookbacks.
 
@@ -51,9 +133,22 @@ def multi_timeframe_rsi(series: pd.Series, periods: list[int] = [14, 30, 50]) ->
         pd.DataFrame: Columns named 'rsi_{period}'.
     """
 
-    out = pd.DataFrame(index=series.index)
-    for p in periods:
-        out[f"rsi_{p}"] = rsi(series, p)
+    columns = [f"rsi_{p}" for p in periods]
+    if NUMBA_AVAILABLE:
+        x = series.to_numpy(dtype=np.float64)
+        arr = _multi_rsi_kernel(x, np.asarray(periods, dtype=np.int64))
+        return pd.DataFrame(arr, index=series.index, columns=columns)
+    return pd.DataFrame({c: rsi(series, p) for c, p in zip(columns, periods)}, index=series.index)
+
+
+@njit(cache=True)
+def _multi_rsi_kernel(x: np.ndarray, periods: np.ndarray) -> np.ndarray:
+    # Serial on purpose: this runs in the API server process, where starting
+    # numba's TBB pool left the process hanging at shutdown, and three
+    # O(n) passes are too little work to gain from threads anyway.
+    out = np.empty((x.shape[0], periods.shape[0]))
+    for j in range(periods.shape[0]):
+        out[:, j] = _rsi_kernel(x, periods[j])
     return out
 
 
@@ -70,12 +165,17 @@ def macd(series: pd.Series, fast: int = 12, slow: int = 26, signal: int = 9) ->
         pd.DataFrame: Columns ['macd','signal','hist'].
     """
 
-    ema_fast = ema(series, fast)
-    ema_slow = ema(series, slow)
-    macd_line = ema_fast - ema_slow
-    signal_line = ema(macd_line, signal)
-    hist = macd_line - signal_line
-    return pd.DataFrame({"macd": macd_line, "signal": signal_line, "hist": hist})
+    if not NUMBA_AVAILABLE:
+        macd_line = ema(series, fast) - ema(series, slow)
+        signal_line = ema(macd_line, signal)
+        return pd.DataFrame({"macd": macd_line, "signal": signal_line, "hist": macd_line - signal_line})
+    x = series.to_numpy(dtype=np.float64)
+    macd_line = _ewma(x, (fast - 1) / 2.0, 1) - _ewma(x, (slow - 1) / 2.0, 1)
+    signal_line = _ewma(macd_line, (signal - 1) / 2.0, 1)
+    return pd.DataFrame(
+        {"macd": macd_line, "signal": signal_line, "hist": macd_line - signal_line},
+        index=series.index,
+    )
 
 
 def stochastic_oscillator(high: pd.Series, low: pd.Series, close: pd.Series, k_period: int = 14, d_period: int = 3) -> pd.DataFrame:
@@ -92,13 +192,66 @@ def stochastic_oscillator(high: pd.Series, low: pd.Series, close: pd.Series, k_p
         pd.DataFrame: Columns ['stoch_k','stoch_d'].
     """
 
-    lowest_low = low.rolling(k_period, min_periods=k_period).min()
-    highest_high = high.rolling(k_period, min_periods=k_period).max()
+    if NUMBA_AVAILABLE:
+        lo, hi = _rolling_min_max(low.to_numpy(dtype=np.float64), high.to_numpy(dtype=np.float64), k_period)
+        lowest_low = pd.Series(lo, index=low.index)
+        highest_high = pd.Series(hi, index=high.index)
+    else:
+        lowest_low = low.rolling(k_period, min_periods=k_period).min()
+        highest_high = high.rolling(k_period, min_periods=k_period).max()
     stoch_k = 100 * (close - lowest_low) / (highest_high - lowest_low)
     stoch_d = stoch_k.rolling(d_period, min_periods=d_period).mean()
     return pd.DataFrame({"stoch_k": stoch_k, "stoch_d": stoch_d})
 
 
+@njit(cache=True)
+def _rolling_min_max(low: np.ndarray, high: np.ndarray, window: int) -> tuple[np.ndarray, np.ndarray]:
+    # Rolling min of `low` and max of `high` in one O(n) pass using monotonic
+    # index deques (flat arrays with head/tail cursors). A window holding any
+    # NaN yields NaN, matching rolling(window, min_periods=window).
+    n = low.shape[0]
+    lowest = np.full(n, np.nan)
+    highest = np.full(n, np.nan)
+    qmin = np.empty(n, dtype=np.int64)
+    qmax = np.empty(n, dtype=np.int64)
+    hmin = tmin = hmax = tmax = 0
+    nan_low = nan_high = 0
+    for i in range(n):
+        v = low[i]
+        if np.isnan(v):
+            nan_low += 1
+        else:
+            while tmin > hmin and low[qmin[tmin - 1]] >= v:
+                tmin -= 1
+            qmin[tmin] = i
+            tmin += 1
+        v = high[i]
+        if np.isnan(v):
+            nan_high += 1
+        else:
+            while tmax > hmax and high[qmax[tmax - 1]] <= v:
+                tmax -= 1
+            qmax[tmax] = i
+            tmax += 1
+
+        start = i - window + 1
+        if start > 0:
+            if np.isnan(low[start - 1]):
+                nan_low -= 1
+            if np.isnan(high[start - 1]):
+                nan_high -= 1
+        while hmin < tmin and qmin[hmin] < start:
+            hmin += 1
+        while hmax < tmax and qmax[hmax] < start:
+            hmax += 1
+        if start >= 0:
+            if nan_low == 0:
+                lowest[i] = low[qmin[hmin]]
+            if nan_high == 0:
+                highest[i] = high[qmax[hmax]]
+    return lowest, highest
+
+
 def bollinger_bands(series: pd.Series, period: int = 20, num_std: float = 2.0) -> pd.DataFrame:
     """Bollinger Bands with BandWidth.
 
@@ -111,8 +264,9 @@ def bollinger_bands(series: pd.Series, period: int = 20, num_std: float = 2.0) -
         pd.DataFrame: ['bb_mid','bb_upper','bb_lower','bb_bandwidth'].
     """
 
-    mid = series.rolling(period, min_periods=period).mean()
-    std = series.rolling(period, min_periods=period).std()
+    r = series.rolling(period, min_periods=period)
+    mid = r.mean().to_numpy()
+    std = r.std().to_numpy()
     upper = mid + num_std * std
     lower = mid - num_std * std
     bandwidth = (upper - lower) / mid
@@ -121,7 +275,7 @@ def bollinger_bands(series: pd.Series, period: int = 20, num_std: float = 2.0) -
         "bb_upper": upper,
         "bb_lower": lower,
         "bb_bandwidth": bandwidth,
-    })
+    }, index=series.index)
 
 
 def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) -> pd.Series:
@@ -135,13 +289,15 @@ def atr(high: pd.Series, low: pd.Series, close: pd.Series, period: int = 14) ->
         pd.Series: ATR values.
     """
 
-    prev_close = close.shift(1)
-    tr = pd.concat([
-        high - low,
-        (high - prev_close).abs(),
-        (low - prev_close).abs(),
-    ], axis=1).max(axis=1)
-    return tr.rolling(period, min_periods=period).mean()
+    h = high.to_numpy(dtype=np.float64)
+    lo = low.to_numpy(dtype=np.float64)
+    c = close.to_numpy(dtype=np.float64)
+    prev_close = np.empty_like(c)
+    prev_close[:1] = np.nan
+    prev_close[1:] = c[:-1]
+    # fmax skips NaNs like DataFrame.max(axis=1), so the first bar keeps high - low
+    tr = np.fmax.reduce([h - lo, np.abs(h - prev_close), np.abs(lo - prev_close)])
+    return pd.Series(tr, index=close.index).rolling(period, min_periods=period).mean()
 
 
 def roc(series: pd.Series, period: int = 12) -> pd.Series:
@@ -165,14 +321,20 @@ def vwap_deviation(high: pd.Series, low: pd.Series, close: pd.Series, volume: pd
         pd.Series: (close - vwap) / vwap
     """
 
-    typical = (high + low + close) / 3.0
-    cum_vp = (typical * volume).cumsum()
-    cum_vol = volume.cumsum().replace(0, np.nan)
+    c = close.to_numpy(dtype=np.float64)
+    v = volume.to_numpy(dtype=np.float64)
+    vp = (high.to_numpy(dtype=np.float64) + low.to_numpy(dtype=np.float64) + c) / 3.0 * v
+    # nancumsum + re-masking reproduces pandas' skipna cumsum: a gap is NaN
+    # itself but does not poison the running totals after it
+    cum_vp = np.nancumsum(vp)
+    cum_vp[np.isnan(vp)] = np.nan
+    cum_vol = np.nancumsum(v)
+    cum_vol[np.isnan(v) | (cum_vol == 0)] = np.nan
     vwap = cum_vp / cum_vol
-    return (close - vwap) / vwap
+    return pd.Series((c - vwap) / vwap, index=close.index)
 
 
-def fractal_dimension_index(series: pd.Series, window: int = 14) -> pd.Series:
+def fractal_dimension_index(series: pd.Series, window: int = 14, log_series: pd.Series | None = None) -> pd.Series:
     """Fractal Dimension Index (FDI) estimator.
 
     Uses the approach based on the ratio of multi-scale path lengths.
@@ -180,41 +342,90 @@ def fractal_dimension_index(series: pd.Series, window: int = 14) -> pd.Series:
     Args:
         series (pd.Series): Price series.
         window (int): Rolling window size.
+        log_series (pd.Series | None): Precomputed ``log(series)``, if the caller has it.
 
     Returns:
         pd.Series: FDI values roughly in [1,2]. Higher implies more noise.
     """
 
-    s = series.apply(np.log).replace([np.inf, -np.inf], np.nan)
-    def _fdi(x: pd.Series) -> float:
-        x = x.dropna().values
-        if len(x) < 5:
-            return np.nan
-        L1 = np.sum(np.abs(np.diff(x)))
-        L2 = np.sum(np.abs(x[2:] - x[:-2])) * (len(x) - 1) / (len(x) - 2) if len(x) > 2 else np.nan
-        if L1 <= 0 or L2 <= 0 or np.isnan(L2):
-            return np.nan
-        return 1 + np.log(L2 / L1) / np.log(2)
-    return s.rolling(window).apply(_fdi, raw=False)
+    if log_series is not None:
+        logs = log_series.to_numpy(dtype=np.float64, copy=True)
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            logs = np.log(series.to_numpy(dtype=np.float64))
+    logs[~np.isfinite(logs)] = np.nan
+    rolled = pd.Series(logs, index=series.index).rolling(window)
+    # min_periods defaults to window, so every evaluated window is NaN-free
+    if NUMBA_AVAILABLE:
+        return rolled.apply(_fdi_window, raw=True, engine="numba")
+    return rolled.apply(_fdi_window, raw=True)
+
+
+@njit(cache=True)
+def _fdi_window(x: np.ndarray) -> float:
+    n = x.shape[0]
+    if n < 5:
+        return np.nan
+    l1 = 0.0
+    for i in range(1, n):
+        l1 += abs(x[i] - x[i - 1])
+    l2 = 0.0
+    for i in range(2, n):
+        l2 += abs(x[i] - x[i - 2])
+    l2 *= (n - 1) / (n - 2)
+    if l1 <= 0 or l2 <= 0:
+        return np.nan
+    return 1 + np.log(l2 / l1) / np.log(2)
 
 
-def hurst_exponent(series: pd.Series, max_lag: int = 20) -> float:
+def hurst_exponent(series: pd.Series, max_lag: int = 20, log_series: pd.Series | None = None) -> float:
     """Estimate Hurst exponent using aggregated variance method.
 
     Args:
         series (pd.Series): Price series.
         max_lag (int): Maximum lag to consider.
+        log_series (pd.Series | None): Precomputed ``log(series)``, if the caller has it.
 
     Returns:
         float: H in (0,1). 0.5 ~ random walk, >0.5 trending, <0.5 mean-reverting.
     """
 
-    x = np.log(series.replace(0, np.nan)).dropna().values
+    if log_series is not None:
+        logs = log_series.to_numpy(dtype=np.float64)
+    else:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            logs = np.log(series.to_numpy(dtype=np.float64))
+    # zero prices (-inf) and missing/negative ones (NaN) are dropped
+    x = logs[~(np.isnan(logs) | np.isneginf(logs))]
     if len(x) < max_lag * 2:
         return np.nan
     taus = np.arange(2, max_lag + 1)
-    variances = [np.var(x[lag:] - x[:-lag]) for lag in taus]
+    if NUMBA_AVAILABLE:
+        variances = _lag_diff_variances(np.ascontiguousarray(x, dtype=np.float64), taus)
+    else:
+        # interpreted loops would be far slower than numpy's per-lag slicing
+        variances = [np.var(x[lag:] - x[:-lag]) for lag in taus]
     with np.errstate(divide='ignore', invalid='ignore'):
         poly = np.polyfit(np.log(taus), np.log(variances), 1)
     hurst = poly[0] / 2.0
     return float(hurst)
+
+
+@njit(cache=True)
+def _lag_diff_variances(x: np.ndarray, taus: np.ndarray) -> np.ndarray:
+    # var(x[lag:] - x[:-lag]) per lag, without materializing the differences
+    n = x.shape[0]
+    out = np.empty(taus.shape[0])
+    for k in range(taus.shape[0]):
+        lag = taus[k]
+        m = n - lag
+        total = 0.0
+        for i in range(m):
+            total += x[i + lag] - x[i]
+        mean = total / m
+        ss = 0.0
+        for i in range(m):
+            d = x[i + lag] - x[i] - mean
+            ss += d * d
+        out[k] = ss / m
+    return out
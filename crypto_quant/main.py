@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import math
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict
 
 import numpy as np
@@ -23,7 +24,7 @@ from .models.lstm_model import lstm_predict_next_prices
 from .models.hmm_regime import fit_hmm_regimes
 from .models.monte_carlo import mc_hit_probability
 from .models.garch_model import fit_garch_and_forecast
-from .risk.risk_metrics import sharpe_ratio, sortino_ratio, max_drawdown, calmar_ratio, rolling_risk_metrics
+from .risk.risk_metrics import full_risk_metrics, rolling_risk_metrics
 from .risk.exit_signals import exit_signal
 from .ensemble.meta_learner import blend_forecasts
 
@@ -35,63 +36,86 @@ def _ensure_close(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _last_value(df: pd.DataFrame, col: str) -> float | None:
+    if col in df.columns and len(df):
+        return float(df[col].iat[-1])
+    return None
+
+
 def compute_indicators(df: pd.DataFrame) -> pd.DataFrame:
     """Compute a suite of technical indicators and return merged DataFrame."""
 
     d = _ensure_close(df)
-    out = d.copy()
-    out = out.sort_values("date").reset_index(drop=True)
+    out = d.sort_values("date").reset_index(drop=True)
     close = out["close"]
     high = out.get("high", close)
     low = out.get("low", close)
-    volume = out.get("volume", pd.Series(index=out.index, data=np.nan)).fillna(method="ffill").fillna(0)
-
-    out = pd.concat([
-        out,
+    volume = out.get("volume", pd.Series(0.0, index=out.index)).ffill().fillna(0.0)
+    # log(close) feeds fdi, hurst, returns and the LSTM; take it once
+    with np.errstate(divide="ignore", invalid="ignore"):
+        log_close = pd.Series(np.log(close.to_numpy(dtype=np.float64)), index=out.index)
+
+    # Collect every column and build the frame once rather than concat-ing
+    # indicator frames and then inserting columns one at a time.
+    cols: Dict[str, object] = dict(out.items())
+    for ind in (
         multi_timeframe_rsi(close),
         macd(close),
         stochastic_oscillator(high, low, close),
         bollinger_bands(close),
-    ], axis=1)
-    out["atr"] = atr(high, low, close)
-    out["roc_12"] = roc(close)
-    out["vwap_dev"] = vwap_deviation(high, low, close, volume)
-    out["fdi_14"] = fractal_dimension_index(close)
-    out["hurst"] = hurst_exponent(close)
-    out["ret"] = np.log(close).diff()
-    out["realized_vol_30"] = realized_volatility(out["ret"])
-    return out
+    ):
+        cols.update(ind.items())
+    cols["atr"] = atr(high, low, close)
+    cols["roc_12"] = roc(close)
+    cols["vwap_dev"] = vwap_deviation(high, low, close, volume)
+    cols["fdi_14"] = fractal_dimension_index(close, log_series=log_close)
+    cols["hurst"] = hurst_exponent(close, log_series=log_close)
+    cols["log_close"] = log_close
+    cols["ret"] = log_close.diff()
+    cols["realized_vol_30"] = realized_volatility(cols["ret"])
+    return pd.DataFrame(cols, index=out.index)
 
 
 def compute_risk_metrics(out: pd.DataFrame) -> Dict[str, float]:
     close = out["close"].dropna()
-    rets = np.log(close).diff().dropna()
-    return {
-        "sharpe": sharpe_ratio(rets),
-        "sortino": sortino_ratio(rets),
-        "max_drawdown": max_drawdown(close),
-        "calmar": calmar_ratio(rets, close),
-    }
+    # the metrics skip NaNs themselves, so the leading NaN of diff() can stay
+    rets = np.log(close).diff()
+    return full_risk_metrics(rets, close)
 
 
 def run_models(out: pd.DataFrame) -> Dict[str, dict]:
-    """Run all models and collect their outputs."""
-
-    arima_fc = fit_arima_forecast(out)
-    prophet_fc = fit_prophet_forecast(out)
-    lstm_fc = lstm_predict_next_prices(out)
-    hmm = fit_hmm_regimes(out)
-    mc = mc_hit_probability(out)
-    garch = fit_garch_and_forecast(out["ret"]) if "ret" in out.columns else {"model": None, "vol_forecast": np.array([])}
-
-    models = {
-        "arima": arima_fc,
-        "prophet": prophet_fc,
-        "lstm": lstm_fc,
-        "hmm": hmm,
-        "mc": mc,
-        "garch": garch,
+    """Run all models and collect their outputs.
+
+    The models are independent, so with ``CRYPTO_QUANT_PARALLEL_MODELS=1`` they
+    run concurrently in threads. The heavy parts (torch, Stan via Prophet,
+    numpy/BLAS and the ``nogil`` Monte Carlo kernel) release the GIL; the
+    statsmodels/pmdarima and hmmlearn fits are partly pure Python and
+    overlap less. Any numba kernel reached from here must stay serial:
+    ``parallel=True`` started off the main thread deadlocks the interpreter
+    at exit under the TBB threading layer.
+
+    This is off by default: models that share numpy's global RNG then draw
+    from it in a nondeterministic order, so results are no longer
+    reproducible under ``set_seed``.
+    """
+
+    tasks = {
+        "arima": (fit_arima_forecast, out),
+        "prophet": (fit_prophet_forecast, out),
+        "lstm": (lstm_predict_next_prices, out),
+        "hmm": (fit_hmm_regimes, out),
+        "mc": (mc_hit_probability, out),
     }
+    if "ret" in out.columns:
+        tasks["garch"] = (fit_garch_and_forecast, out["ret"])
+
+    if os.getenv("CRYPTO_QUANT_PARALLEL_MODELS") == "1":
+        with ThreadPoolExecutor(max_workers=len(tasks)) as ex:
+            futs = {name: ex.submit(fn, arg) for name, (fn, arg) in tasks.items()}
+            models = {name: f.result() for name, f in futs.items()}
+    else:
+        models = {name: fn(arg) for name, (fn, arg) in tasks.items()}
+    models.setdefault("garch", {"model": None, "vol_forecast": np.array([])})
     return models
 
 
@@ -109,23 +133,25 @@ def main() -> None:
         last_date = hist["date"].max().normalize()
         today = pd.Timestamp.utcnow().normalize()
         if today > last_date:
-            row = {"date": today, "close": float(rt_price), "price": float(rt_price)}
-            hist = pd.concat([hist, pd.DataFrame([row])], ignore_index=True)
+            hist.loc[len(hist), ["date", "close", "price"]] = [today, float(rt_price), float(rt_price)]
 
     # 3. Compute indicators and risk metrics
     feats = compute_indicators(hist)
     risk = compute_risk_metrics(feats)
 
     # ancillary data (best-effort)
+    # only the latest reading of each series is used
     mvrv = fetch_mvrv_z_score()
     nvt = fetch_nvt_ratio()
-    funding = fetch_funding_rate().tail(1)
-    oi = fetch_open_interest().tail(1)
-    lsr = fetch_long_short_ratio().tail(1)
-    fng = fetch_fear_greed_index().tail(1)
-    dxy = fetch_dxy_yfinance().tail(1)
+    latest_funding = _last_value(fetch_funding_rate(), "fundingRate")
+    latest_oi = _last_value(fetch_open_interest(), "openInterest")
+    latest_lsr = _last_value(fetch_long_short_ratio(), "longShortRatio")
+    latest_fng = _last_value(fetch_fear_greed_index(), "value")
+    latest_dxy = _last_value(fetch_dxy_yfinance(), "close")
     spcorr = sp500_correlation_with_btc(hist)
-    rates = fetch_fred_interest_rates().tail(1)
+    rates = fetch_fred_interest_rates()
+    latest_dgs2 = _last_value(rates, "DGS2")
+    latest_dgs10 = _last_value(rates, "DGS10")
 
     # 4. Run ALL models
     models = run_models(feats)
@@ -146,7 +172,6 @@ def main() -> None:
     blended = blend_forecasts(forecasts, last_price, regime=regime)
 
     # 6. Risk-adjusted exit recommendation
-    latest_funding = float(funding["fundingRate"].iloc[0]) if len(funding) else None
     exit_rec = exit_signal(hist, regime=regime, funding_rate=latest_funding)
 
     # 7. Probability to hit 99k (from Monte Carlo)
@@ -1,12 +1,76 @@
 """ARIMA modeling via pmdarima."""
 from __future__ import annotations
 
+import hashlib
+import json
+import os
+from typing import Any, Dict, Optional
+
+import numpy as np
 import pandas as pd
 
+from ..utils.cache import CACHE_DIR
+
+
+# auto_arima's stepwise order search dominates the fit cost, so the selected
+# order is remembered per input series and refit directly on warm calls.
+# The key leaves out the last bar: the CLI and the API append the realtime
+# price as that row, and it moves on every call. One extra bar does not
+# change which order fits, and the model is still refit on the full series.
+_ORDER_CACHE_PATH = os.path.join(CACHE_DIR, "arima_order.json")
+_ORDER_CACHE_MAX = 32
+
+
+def _series_key(y: np.ndarray) -> str:
+    return hashlib.blake2b(y.tobytes()[-4096:], digest_size=8).hexdigest()
+
+
+def _load_orders() -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(_ORDER_CACHE_PATH, "r", encoding="utf-8") as f:
+            orders = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return orders if isinstance(orders, dict) else {}
+
+
+def _save_order(key: str, spec: Dict[str, Any]) -> None:
+    orders = _load_orders()
+    orders.pop(key, None)
+    orders[key] = spec
+    # keep only the most recently stored entries
+    orders = dict(list(orders.items())[-_ORDER_CACHE_MAX:])
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = f"{_ORDER_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(orders, f)
+        os.replace(tmp, _ORDER_CACHE_PATH)
+    except OSError:
+        pass
+
+
+def _fit_cached_order(pm: Any, y: np.ndarray, spec: Dict[str, Any]) -> Optional[Any]:
+    try:
+        model = pm.ARIMA(
+            order=tuple(spec["order"]),
+            seasonal_order=tuple(spec["seasonal_order"]),
+            with_intercept=spec["with_intercept"],
+            suppress_warnings=True,
+        )
+        return model.fit(y)
+    except Exception:
+        # stale or unusable entry; let auto_arima search again
+        return None
+
 
 def fit_arima_forecast(df: pd.DataFrame, horizons=(1, 7, 30)) -> dict:
     """Fit ARIMA model on daily close and forecast given horizons.
 
+    The order chosen by ``auto_arima`` is cached on disk keyed by the tail of
+    the series before its last bar, so repeated runs on the same history skip
+    the order search even when the latest (realtime) price has moved.
+
     Args:
         df (pd.DataFrame): Daily data with 'date' and 'close' or 'price'.
         horizons (tuple): Forecast horizons in days.
@@ -18,17 +82,25 @@ def fit_arima_forecast(df: pd.DataFrame, horizons=(1, 7, 30)) -> dict:
     try:
         import pmdarima as pm  # type: ignore
 
-        data = df.copy()
-        if "close" not in data.columns and "price" in data.columns:
-            data["close"] = data["price"]
-        y = data["close"].dropna().astype(float).values
+        col = "price" if "close" not in df.columns and "price" in df.columns else "close"
+        y = df[col].dropna().to_numpy(dtype=np.float64)
         if len(y) < 30:
             return {h: float("nan") for h in horizons}
-        model = pm.auto_arima(y, seasonal=False, error_action="ignore", suppress_warnings=True)
-        out = {}
-        for h in horizons:
-            fc = model.predict(n_periods=h)
-            out[h] = float(fc[-1])
-        return out
+        key = _series_key(y[:-1])
+        spec = _load_orders().get(key)
+        model = _fit_cached_order(pm, y, spec) if spec is not None else None
+        if model is None:
+            model = pm.auto_arima(y, seasonal=False, error_action="ignore", suppress_warnings=True)
+            _save_order(
+                key,
+                {
+                    "order": list(model.order),
+                    "seasonal_order": list(model.seasonal_order),
+                    "with_intercept": bool(model.with_intercept),
+                },
+            )
+        # One forecast over the longest horizon covers the shorter ones
+        fc = np.asarray(model.predict(n_periods=max(horizons)))
+        return {h: float(fc[h - 1]) for h in horizons}
     except Exception:
         return {h: float("nan") for h in horizons}
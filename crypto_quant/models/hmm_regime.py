@@ -19,10 +19,8 @@ def fit_hmm_regimes(df: pd.DataFrame, n_states: int = 3) -> dict:
     try:
         from hmmlearn.hmm import GaussianHMM  # type: ignore
 
-        data = df.copy()
-        if "close" not in data.columns and "price" in data.columns:
-            data["close"] = data["price"]
-        data = data.dropna(subset=["close"]).copy()
+        col = "price" if "close" not in df.columns and "price" in df.columns else "close"
+        data = df[[col]].rename(columns={col: "close"}).dropna(subset=["close"])
         data["ret"] = np.log(data["close"]).diff()
         X = data["ret"].dropna().values.reshape(-1, 1)
         if len(X) < 50:
@@ -30,7 +28,10 @@ def fit_hmm_regimes(df: pd.DataFrame, n_states: int = 3) -> dict:
         hmm = GaussianHMM(n_components=n_states, covariance_type="full", n_iter=200)
         hmm.fit(X)
         states = hmm.predict(X)
-        means = np.array([X[states == i].mean() for i in range(n_states)])
+        # Per-state mean return in one pass; unused states sort last like a NaN mean
+        counts = np.bincount(states, minlength=n_states)
+        sums = np.bincount(states, weights=X.ravel(), minlength=n_states)
+        means = np.where(counts > 0, sums / np.maximum(counts, 1), np.nan)
         order = np.argsort(means)
         mapping = {order[0]: "bear", order[1]: "sideways", order[2]: "bull"}
         labeled_states = pd.Series([mapping[s] for s in states], index=data.index[data.index.get_loc(data.index.min()) + 1 :])
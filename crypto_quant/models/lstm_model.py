@@ -9,7 +9,8 @@ def lstm_predict_next_prices(df: pd.DataFrame, lookback: int = 30, epochs: int =
     """Train a small LSTM on log returns and predict next prices.
 
     Args:
-        df (pd.DataFrame): Daily data with 'date' and 'close' or 'price'.
+        df (pd.DataFrame): Daily data with 'date' and 'close' or 'price'; an
+            optional 'log_close' column is reused instead of recomputing logs.
         lookback (int): Sequence length.
         epochs (int): Training epochs (kept small for speed).
         hidden (int): Hidden size.
@@ -22,21 +23,27 @@ def lstm_predict_next_prices(df: pd.DataFrame, lookback: int = 30, epochs: int =
         import torch
         import torch.nn as nn
 
-        data = df.copy()
-        if "close" not in data.columns and "price" in data.columns:
-            data["close"] = data["price"]
-        y = data["close"].dropna().astype(float).values
+        col = "price" if "close" not in df.columns and "price" in df.columns else "close"
+        valid = df[col].notna().to_numpy()
+        y = df[col].to_numpy(dtype=np.float64)[valid]
         if len(y) < lookback + 5:
             return {"next_return": float("nan"), "next_price": float("nan")}
-        logp = np.log(y + 1e-9)
-        rets = np.diff(logp)
-        X = []
-        Y = []
-        for i in range(len(rets) - lookback):
-            X.append(rets[i : i + lookback])
-            Y.append(rets[i + lookback])
-        X = torch.tensor(np.array(X), dtype=torch.float32).unsqueeze(-1)
-        Y = torch.tensor(np.array(Y), dtype=torch.float32).unsqueeze(-1)
+        logp = None
+        if "log_close" in df.columns and col == "close":
+            # already computed alongside the indicators
+            logp = df["log_close"].to_numpy(dtype=np.float64)[valid]
+            if not np.isfinite(logp).all():
+                logp = None  # zero prices; use the epsilon-guarded log below
+        if logp is None:
+            logp = np.log(y + 1e-9)
+        # Returns are computed in float64, then cast once to the contiguous
+        # float32 buffer the network consumes; tensors below share its memory.
+        rets = np.ascontiguousarray(np.diff(logp), dtype=np.float32)
+        # Training windows are rets[i : i + lookback] with target rets[i + lookback];
+        # take them as one strided view and copy once into a contiguous batch.
+        windows = np.lib.stride_tricks.sliding_window_view(rets, lookback)[:-1]
+        X = torch.from_numpy(np.ascontiguousarray(windows)).unsqueeze(-1)
+        Y = torch.from_numpy(rets[lookback:]).unsqueeze(-1)
 
         class LSTM(nn.Module):
             def __init__(self, hidden: int):
@@ -61,8 +68,9 @@ def lstm_predict_next_prices(df: pd.DataFrame, lookback: int = 30, epochs: int =
             opt.step()
 
         model.eval()
-        last_seq = torch.tensor(rets[-lookback:], dtype=torch.float32).unsqueeze(0).unsqueeze(-1)
-        next_ret = float(model(last_seq).detach().numpy().ravel()[0])
+        last_seq = torch.from_numpy(rets[-lookback:]).unsqueeze(0).unsqueeze(-1)
+        with torch.no_grad():
+            next_ret = float(model(last_seq).numpy().ravel()[0])
         next_price = float(np.exp(np.log(y[-1]) + next_ret))
         return {"next_return": next_ret, "next_price": next_price}
     except Exception:
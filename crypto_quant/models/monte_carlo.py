@@ -4,6 +4,36 @@ from __future__ import annotations
 import numpy as np
 import pandas as pd
 
+from ..utils._njit import NUMBA_AVAILABLE, njit
+
+
+# Paths are split into fixed blocks, each seeded on its own, so JIT results
+# are reproducible block by block.
+_MC_BLOCKS = 64
+# Rows per block in the numpy fallback; keeps the working set cache-sized.
+_MC_CHUNK = 1024
+
+
+# Serial on purpose: a parallel=True kernel started off the main thread (the
+# threaded run_models path) brings up numba's TBB layer there and the
+# interpreter deadlocks at exit. nogil lets such a thread overlap other work.
+@njit(nogil=True, cache=True)
+def _mc_first_hit_kernel(drift: float, sigma: float, log_target: float, paths: int, steps: int, seed: int) -> np.ndarray:
+    # First step (1-based) at which each path's log-return reaches log_target;
+    # steps + 1 if it never does. Paths stream one draw at a time.
+    first_hit = np.full(paths, steps + 1, dtype=np.int64)
+    per_block = (paths + _MC_BLOCKS - 1) // _MC_BLOCKS
+    for b in range(_MC_BLOCKS):
+        np.random.seed(seed + b)
+        for i in range(b * per_block, min(paths, (b + 1) * per_block)):
+            logp = 0.0
+            for t in range(steps):
+                logp += drift + sigma * np.random.standard_normal()
+                if logp >= log_target:
+                    first_hit[i] = t + 1
+                    break
+    return first_hit
+
 
 def mc_hit_probability(df: pd.DataFrame, target_price: float = 99_000.0, paths: int = 10_000, horizons=(1, 7, 30)) -> dict:
     """Run geometric Brownian motion simulations to estimate hit probability.
@@ -18,10 +48,8 @@ def mc_hit_probability(df: pd.DataFrame, target_price: float = 99_000.0, paths:
         dict: {horizon: probability}
     """
 
-    data = df.copy()
-    if "close" not in data.columns and "price" in data.columns:
-        data["close"] = data["price"]
-    px = data["close"].dropna().astype(float).values
+    col = "price" if "close" not in df.columns and "price" in df.columns else "close"
+    px = df[col].dropna().to_numpy(dtype=np.float64)
     if len(px) < 50:
         return {h: float("nan") for h in horizons}
     log_ret = np.diff(np.log(px))
@@ -30,14 +58,33 @@ def mc_hit_probability(df: pd.DataFrame, target_price: float = 99_000.0, paths:
     s0 = float(px[-1])
 
     out: dict[int, float] = {}
-    for H in horizons:
-        dt = 1.0
-        steps = int(H)
-        # simulate paths
-        Z = np.random.normal(size=(paths, steps))
-        increments = (mu - 0.5 * sigma ** 2) * dt + sigma * np.sqrt(dt) * Z
-        log_paths = np.cumsum(increments, axis=1)
-        S = s0 * np.exp(log_paths)
-        hit = (S >= target_price).any(axis=1)
-        out[H] = float(hit.mean())
+    if NUMBA_AVAILABLE:
+        # One streamed simulation over the longest horizon serves every horizon;
+        # the seed is drawn from numpy's global RNG so set_seed() still applies.
+        seed = int(np.random.randint(0, 2**31 - _MC_BLOCKS))
+        first_hit = _mc_first_hit_kernel(
+            mu - 0.5 * sigma ** 2, sigma, float(np.log(target_price / s0)), paths, int(max(horizons)), seed
+        )
+        for H in horizons:
+            out[H] = float(np.mean(first_hit <= int(H)))
+        return out
+
+    # numpy fallback: antithetic pairs (Z, -Z) halve the draws for the same
+    # variance, and paths are simulated in chunks so only a small block of
+    # the (paths, steps) matrix is ever resident. Odd counts round down to pairs.
+    steps = int(max(horizons))
+    drift = mu - 0.5 * sigma ** 2
+    log_target = float(np.log(target_price / s0))
+    half = max(paths // 2, 1)
+    hits = np.zeros(len(horizons), dtype=np.int64)
+    cols = np.asarray([int(H) - 1 for H in horizons])
+    for start in range(0, half, _MC_CHUNK):
+        Z = np.random.normal(size=(min(_MC_CHUNK, half - start), steps))
+        for sign in (1.0, -1.0):
+            log_paths = np.cumsum(drift + sigma * sign * Z, axis=1)
+            # running max turns "hit within H steps" into one column lookup
+            peak = np.maximum.accumulate(log_paths, axis=1)
+            hits += (peak[:, cols] >= log_target).sum(axis=0)
+    for H, n_hit in zip(horizons, hits):
+        out[H] = float(n_hit / (2 * half))
     return out
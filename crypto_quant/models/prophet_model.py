@@ -1,12 +1,38 @@
 """Prophet forecasting model."""
 from __future__ import annotations
 
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Tuple
+
+import numpy as np
 import pandas as pd
 
 
+# Fitting dominates Prophet's cost, so recent forecasts are kept per input
+# series: {key: yhat for days 1..H past the last observation}. The key covers
+# the last value on purpose, since the cached forecast is only valid for that
+# exact series. The CLI and the API append the moving realtime price as the
+# last row, so there the cache rarely hits. It pays off on repeated offline
+# runs over an unchanged history (e.g. BTC_HIST_CSV without a realtime quote).
+_FORECAST_CACHE: "OrderedDict[Tuple, np.ndarray]" = OrderedDict()
+_FORECAST_CACHE_MAX = 8
+_FORECAST_CACHE_LOCK = threading.Lock()
+
+
+def _series_key(d: pd.DataFrame) -> Tuple:
+    y = d["y"].to_numpy(dtype=np.float64)
+    return d["ds"].max(), len(d), hashlib.blake2b(y.tobytes()[-4096:], digest_size=8).hexdigest()
+
+
 def fit_prophet_forecast(df: pd.DataFrame, horizons=(1, 7, 30)) -> dict:
     """Fit Prophet on daily close and forecast horizons.
 
+    Forecasts are cached in memory for the last few input series, so repeated
+    calls on identical data skip the fit and predict. Any change to the
+    series, including a new realtime last price, is a miss.
+
     Args:
         df (pd.DataFrame): DataFrame with 'date' and 'close' or 'price'.
         horizons (tuple): Days ahead to forecast.
@@ -18,25 +44,38 @@ def fit_prophet_forecast(df: pd.DataFrame, horizons=(1, 7, 30)) -> dict:
     try:
         from prophet import Prophet  # type: ignore
 
-        data = df.copy()
-        if "close" not in data.columns and "price" in data.columns:
-            data["close"] = data["price"]
-        d = data[["date", "close"]].dropna().rename(columns={"date": "ds", "close": "y"})
+        col = "price" if "close" not in df.columns and "price" in df.columns else "close"
+        d = df[["date", col]].dropna().rename(columns={"date": "ds", col: "y"})
         if len(d) < 30:
             return {h: float("nan") for h in horizons}
-        m = Prophet(daily_seasonality=True, weekly_seasonality=True, yearly_seasonality=True)
-        m.fit(d)
-        out = {}
         max_h = max(horizons)
-        future = m.make_future_dataframe(periods=max_h, freq="D")
-        fc = m.predict(future)
-        fc = fc.set_index("ds")
-        for h in horizons:
-            ts = d["ds"].max() + pd.Timedelta(days=h)
-            if ts in fc.index:
-                out[h] = float(fc.loc[ts, "yhat"])  # type: ignore
-            else:
-                out[h] = float("nan")
-        return out
+        key = _series_key(d)
+        with _FORECAST_CACHE_LOCK:
+            hit = _FORECAST_CACHE.get(key)
+            if hit is not None:
+                _FORECAST_CACHE.move_to_end(key)
+        if hit is not None and len(hit) >= max_h:
+            yhat = hit
+        else:
+            # Only fit seasonal terms the history can support: yearly needs
+            # two full cycles, weekly four. Intra-day seasonality means
+            # nothing on daily bars, so it is always off.
+            m = Prophet(
+                daily_seasonality=False,
+                weekly_seasonality=len(d) >= 28,
+                yearly_seasonality=len(d) >= 730,
+            )
+            m.fit(d)
+            future = m.make_future_dataframe(periods=max_h, freq="D")
+            fc = m.predict(future)
+            # the future frame ends with exactly max_h daily steps past the
+            # last date, so horizon h sits at position h - 1 of that tail
+            yhat = fc["yhat"].to_numpy()[-max_h:]
+            with _FORECAST_CACHE_LOCK:
+                _FORECAST_CACHE[key] = yhat
+                _FORECAST_CACHE.move_to_end(key)
+                while len(_FORECAST_CACHE) > _FORECAST_CACHE_MAX:
+                    _FORECAST_CACHE.popitem(last=False)
+        return {h: float(yhat[h - 1]) if h >= 1 else float("nan") for h in horizons}
     except Exception:
         return {h: float("nan") for h in horizons}
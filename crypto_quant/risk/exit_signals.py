@@ -1,10 +1,154 @@
 """Risk-adjusted exit signals combining multiple conditions."""
 from __future__ import annotations
 
+import hashlib
+import threading
+from typing import Any, Dict, Optional
+
 import numpy as np
 import pandas as pd
 
-from ..indicators.technical import rsi, macd
+from ..utils._njit import njit
+
+
+# exit_signal only reads the last RSI and the last two MACD/signal values, and
+# successive calls usually see the same history plus a bar or two. The EMA and
+# Wilder recurrence states are kept from the previous call and advanced over
+# new bars only. Slots of the state vector:
+_S_PREV = 0  # last close (for the RSI delta)
+_S_FAST, _S_SLOW, _S_SIG, _S_GAIN, _S_LOSS = 1, 3, 5, 7, 9  # EWM mean; slot + 1 holds its weight
+_S_NOBS = 11  # RSI deltas seen
+_S_MACD, _S_MACD_PREV, _S_SIGNAL, _S_SIGNAL_PREV = 12, 13, 14, 15
+_STATE_SIZE = 16
+
+_RSI_PERIOD = 14
+_MIN_HISTORY = 20  # closes required before any price indicator is scored
+_MACD_FAST, _MACD_SLOW, _MACD_SIGNAL = 12, 26, 9
+
+_last_state: Optional[Dict[str, Any]] = None
+_state_lock = threading.Lock()
+
+
+@njit(cache=True)
+def _ewm_step(state: np.ndarray, i: int, cur: float, alpha: float) -> None:
+    # One step of pandas' ewm(adjust=False).mean() recurrence (NaN handling
+    # included); state[i] is the running mean, state[i + 1] its weight.
+    weighted = state[i]
+    if np.isnan(weighted):
+        if not np.isnan(cur):
+            state[i] = cur
+        return
+    old_wt = state[i + 1] * (1.0 - alpha)
+    if not np.isnan(cur):
+        if weighted != cur:
+            weighted = (old_wt * weighted + alpha * cur) / (old_wt + alpha)
+            state[i] = weighted
+        old_wt = 1.0
+    state[i + 1] = old_wt
+
+
+@njit(cache=True)
+def _advance_state(state: np.ndarray, x: np.ndarray, a_fast: float, a_slow: float, a_sig: float, a_rsi: float) -> None:
+    for k in range(x.shape[0]):
+        v = x[k]
+        delta = v - state[_S_PREV]
+        state[_S_PREV] = v
+        _ewm_step(state, _S_FAST, v, a_fast)
+        _ewm_step(state, _S_SLOW, v, a_slow)
+        m = state[_S_FAST] - state[_S_SLOW]
+        _ewm_step(state, _S_SIG, m, a_sig)
+        state[_S_MACD_PREV] = state[_S_MACD]
+        state[_S_SIGNAL_PREV] = state[_S_SIGNAL]
+        state[_S_MACD] = m
+        state[_S_SIGNAL] = state[_S_SIG]
+        if np.isnan(delta):
+            _ewm_step(state, _S_GAIN, np.nan, a_rsi)
+            _ewm_step(state, _S_LOSS, np.nan, a_rsi)
+        else:
+            state[_S_NOBS] += 1.0
+            _ewm_step(state, _S_GAIN, max(delta, 0.0), a_rsi)
+            _ewm_step(state, _S_LOSS, -min(delta, 0.0), a_rsi)
+
+
+def _new_state() -> np.ndarray:
+    state = np.full(_STATE_SIZE, np.nan)
+    state[[_S_FAST + 1, _S_SLOW + 1, _S_SIG + 1, _S_GAIN + 1, _S_LOSS + 1]] = 1.0
+    state[_S_NOBS] = 0.0
+    return state
+
+
+def _span_alpha(span: int) -> float:
+    # same com -> alpha conversion pandas applies for ewm(span=...)
+    return 1.0 / (1.0 + (span - 1) / 2.0)
+
+
+_A_FAST = _span_alpha(_MACD_FAST)
+_A_SLOW = _span_alpha(_MACD_SLOW)
+_A_SIG = _span_alpha(_MACD_SIGNAL)
+_A_RSI = 1.0 / (1.0 + (1.0 - 1.0 / _RSI_PERIOD) / (1.0 / _RSI_PERIOD))
+
+
+def _indicator_state(x: np.ndarray, dates: Optional[pd.Series], rows: np.ndarray) -> np.ndarray:
+    """RSI/MACD recurrence state after the last bar of ``x``.
+
+    The previous call's state is reused when ``x`` extends (or repeats) the
+    series it was built from, judged by a hash of the whole cached prefix and
+    the date at the cached length; otherwise the state is rebuilt from scratch.
+
+    Args:
+        x (np.ndarray): NaN-free closes.
+        dates (pd.Series | None): Date column of the input frame, if any.
+        rows (np.ndarray): Position in ``dates`` of each element of ``x``.
+    """
+
+    global _last_state
+    n = x.shape[0]
+    with _state_lock:
+        cached = _last_state
+    state = None
+    digest = None
+    if cached is not None:
+        m = cached["n"]
+        if 0 < m <= n:
+            # hashing the prefix is a single cheap pass; continuing the same
+            # hasher over x[m:] then gives the digest of all of x
+            digest = hashlib.blake2b(x[:m], digest_size=16)
+            # one scalar lookup; materialising a tz-aware date column boxes
+            # every row into a Timestamp, which costs more than the indicators
+            date = None if dates is None else dates.iat[rows[m - 1]]
+            if digest.digest() == cached["digest"] and date == cached["date"]:
+                state = cached["state"].copy()
+                digest.update(x[m:])
+                _advance_state(state, x[m:], _A_FAST, _A_SLOW, _A_SIG, _A_RSI)
+    if state is None:
+        state = _new_state()
+        _advance_state(state, x, _A_FAST, _A_SLOW, _A_SIG, _A_RSI)
+        digest = hashlib.blake2b(x, digest_size=16)
+    if n:
+        with _state_lock:
+            _last_state = {
+                "n": n,
+                "digest": digest.digest(),
+                "date": None if dates is None else dates.iat[rows[n - 1]],
+                "state": state.copy(),
+            }
+    return state
+
+
+def _rolling_std(x: np.ndarray, window: int) -> np.ndarray:
+    """Sample std of every full ``window``-length slice of ``x`` in O(n).
+
+    Window sums come from prefix sums of the mean-centred data; centring keeps
+    sum(x^2) - sum(x)^2 / window well conditioned for returns.
+    """
+
+    d = x - x.mean()
+    c1 = np.concatenate(([0.0], np.cumsum(d)))
+    c2 = np.concatenate(([0.0], np.cumsum(d * d)))
+    s1 = c1[window:] - c1[:-window]
+    s2 = c2[window:] - c2[:-window]
+    var = (s2 - s1 * s1 / window) / (window - 1)
+    return np.sqrt(np.maximum(var, 0.0))
 
 
 def exit_signal(df: pd.DataFrame, regime: str = "unknown", funding_rate: float | None = None) -> dict:
@@ -27,26 +171,41 @@ def exit_signal(df: pd.DataFrame, regime: str = "unknown", funding_rate: float |
         dict: {'signal': bool, 'score': float, 'explanation': str}
     """
 
-    data = df.copy()
-    if "close" not in data.columns and "price" in data.columns:
-        data["close"] = data["price"]
-    close = data["close"].dropna()
+    col = "price" if "close" not in df.columns and "price" in df.columns else "close"
+    valid = df[col].notna().to_numpy()
+    x = df[col].to_numpy(dtype=np.float64)[valid]
+    dates = df["date"] if "date" in df.columns else None
+    n = x.shape[0]
+    # RSI, volatility and MACD all need more than 20 closes; on shorter
+    # histories (e.g. the first steps of a walk-forward run) skip the price
+    # indicators and score only the regime and funding conditions.
+    enough = n > _MIN_HISTORY
+    state = _indicator_state(x, dates, np.flatnonzero(valid)) if enough else None
     score = 0.0
     parts: list[str] = []
 
     # RSI overbought
-    rsi_val = float(rsi(close).iloc[-1]) if len(close) > 20 else np.nan
+    rsi_val = np.nan
+    if state is not None:
+        avg_gain, avg_loss = state[_S_GAIN], state[_S_LOSS]
+        if state[_S_NOBS] < _RSI_PERIOD or np.isnan(avg_gain) or np.isnan(avg_loss) or avg_loss == 0:
+            rsi_val = 50.0
+        else:
+            rsi_val = float(100 - (100 / (1 + avg_gain / avg_loss)))
     if not np.isnan(rsi_val) and rsi_val > 70:
         score += 1.0
         parts.append(f"RSI is overbought at {rsi_val:.1f} (>70)")
 
-    # Volatility spike (recent std > 75th percentile)
-    rets = np.log(close).diff()
-    recent_vol = float(rets.tail(20).std()) if len(rets) > 20 else np.nan
-    vol_thresh = float(rets.rolling(60).std().dropna().quantile(0.75)) if len(rets) > 60 else np.nan
-    if not np.isnan(recent_vol) and not np.isnan(vol_thresh) and recent_vol > vol_thresh:
-        score += 0.8
-        parts.append("Recent volatility spike above 75th percentile")
+    # Volatility spike (recent std > 75th percentile); needs > 60 closes
+    if n > 60:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rets = np.diff(np.log(x))
+        recent_vol = float(np.std(rets[-20:], ddof=1))
+        r = rets[~np.isnan(rets)]
+        vol_thresh = float(np.quantile(_rolling_std(r, 60), 0.75)) if len(r) >= 60 else np.nan
+        if not np.isnan(recent_vol) and not np.isnan(vol_thresh) and recent_vol > vol_thresh:
+            score += 0.8
+            parts.append("Recent volatility spike above 75th percentile")
 
     # Regime check
     if regime == "bear":
@@ -59,20 +218,20 @@ def exit_signal(df: pd.DataFrame, regime: str = "unknown", funding_rate: float |
         parts.append("Funding rate negative (short bias)")
 
     # MACD bear crossover
-    macd_df = macd(close)
-    if len(macd_df) > 2:
-        if macd_df["macd"].iloc[-1] < macd_df["signal"].iloc[-1] and macd_df["macd"].iloc[-2] >= macd_df["signal"].iloc[-2]:
+    if state is not None:
+        if state[_S_MACD] < state[_S_SIGNAL] and state[_S_MACD_PREV] >= state[_S_SIGNAL_PREV]:
             score += 1.0
             parts.append("MACD bear crossover detected")
 
-    # Price below MA200
-    ma200 = close.rolling(200).mean()
-    if len(ma200.dropna()) > 0 and close.iloc[-1] < ma200.iloc[-1]:
+    # Price below MA200 (only the latest 200-day mean matters)
+    if n >= 200 and x[-1] < x[-200:].mean():
         score += 0.7
         parts.append("Price below 200-day moving average")
 
     signal = score >= 2.0
-    if not parts:
+    if not enough:
+        parts.append("Insufficient price history for indicator checks")
+    elif not parts:
         parts.append("No major risk conditions triggered")
     explanation = "; ".join(parts)
     return {"signal": signal, "score": score, "explanation": explanation}
@@ -1,9 +1,20 @@
 """Risk metrics: Sharpe, Sortino, Max Drawdown, Calmar, Rolling metrics."""
 from __future__ import annotations
 
+import math
+
 import numpy as np
 import pandas as pd
 
+from ..utils._njit import NUMBA_AVAILABLE, njit
+
+
+_SQRT_365 = math.sqrt(365.0)
+
+
+def _annualizer(periods_per_year: int) -> float:
+    return _SQRT_365 if periods_per_year == 365 else math.sqrt(periods_per_year)
+
 
 def sharpe_ratio(returns: pd.Series, risk_free: float = 0.0, periods_per_year: int = 365) -> float:
     """Compute annualized Sharpe ratio.
@@ -17,48 +28,211 @@ def sharpe_ratio(returns: pd.Series, risk_free: float = 0.0, periods_per_year: i
         float: Sharpe ratio.
     """
 
-    excess = returns - risk_free
-    if excess.std(ddof=0) == 0 or excess.dropna().empty:
+    excess = returns.to_numpy(dtype=np.float64) - risk_free
+    excess = excess[~np.isnan(excess)]
+    if excess.size == 0:
         return float("nan")
-    return float((excess.mean() / excess.std(ddof=0)) * np.sqrt(periods_per_year))
+    # one mean, reused for the (mean-centred, cancellation-safe) variance
+    mean = excess.mean()
+    dev = excess - mean
+    std = np.sqrt(np.dot(dev, dev) / excess.size)
+    if std == 0:
+        return float("nan")
+    return float((mean / std) * _annualizer(periods_per_year))
 
 
 def sortino_ratio(returns: pd.Series, risk_free: float = 0.0, periods_per_year: int = 365) -> float:
     """Compute annualized Sortino ratio (downside deviation)."""
 
-    excess = returns - risk_free
-    downside = excess.copy()
-    downside[downside > 0] = 0
-    dd = downside.std(ddof=0)
-    if dd == 0 or excess.dropna().empty:
+    excess = returns.to_numpy(dtype=np.float64) - risk_free
+    excess = excess[~np.isnan(excess)]
+    if excess.size == 0:
+        return float("nan")
+    dd = np.minimum(excess, 0.0).std()
+    if dd == 0:
         return float("nan")
-    return float((excess.mean() / dd) * np.sqrt(periods_per_year))
+    return float((excess.mean() / dd) * _annualizer(periods_per_year))
 
 
 def max_drawdown(prices: pd.Series) -> float:
     """Maximum drawdown as min of (price/peak - 1)."""
 
-    if prices.dropna().empty:
+    arr = prices.to_numpy(dtype=np.float64)
+    arr = arr[~np.isnan(arr)]
+    if arr.size == 0:
         return float("nan")
-    cummax = prices.cummax()
-    drawdown = prices / cummax - 1.0
-    return float(drawdown.min())
+    peak = np.maximum.accumulate(arr)
+    return float(np.min(arr / peak) - 1.0)
 
 
-def calmar_ratio(returns: pd.Series, prices: pd.Series, periods_per_year: int = 365) -> float:
-    """Calmar ratio = annualized return / |max drawdown|."""
+def calmar_ratio(
+    returns: pd.Series,
+    prices: pd.Series,
+    periods_per_year: int = 365,
+    max_dd: float | None = None,
+) -> float:
+    """Calmar ratio = annualized return / |max drawdown|.
+
+    ``max_dd`` lets callers that already computed ``max_drawdown(prices)``
+    pass it in instead of scanning the prices again.
+    """
 
     ann_ret = returns.mean() * periods_per_year
-    mdd = abs(max_drawdown(prices))
+    mdd = abs(max_drawdown(prices) if max_dd is None else max_dd)
     if mdd == 0 or np.isnan(mdd):
         return float("nan")
     return float(ann_ret / mdd)
 
 
+def full_risk_metrics(
+    returns: pd.Series,
+    prices: pd.Series,
+    risk_free: float = 0.0,
+    periods_per_year: int = 365,
+) -> dict:
+    """Sharpe, Sortino, max drawdown and Calmar together.
+
+    Equivalent to calling :func:`sharpe_ratio`, :func:`sortino_ratio`,
+    :func:`max_drawdown` and :func:`calmar_ratio` on the same inputs, but with
+    numba available the moments and the drawdown come from a single sweep
+    over each array instead of one scan per metric.
+
+    Args:
+        returns (pd.Series): Periodic returns.
+        prices (pd.Series): Price series the returns were taken from.
+        risk_free (float): Risk-free rate per period.
+        periods_per_year (int): Annualization factor.
+
+    Returns:
+        dict: {'sharpe', 'sortino', 'max_drawdown', 'calmar'} as floats.
+    """
+
+    if not NUMBA_AVAILABLE:
+        mdd = max_drawdown(prices)
+        return {
+            "sharpe": sharpe_ratio(returns, risk_free, periods_per_year),
+            "sortino": sortino_ratio(returns, risk_free, periods_per_year),
+            "max_drawdown": mdd,
+            "calmar": calmar_ratio(returns, prices, periods_per_year, max_dd=mdd),
+        }
+
+    nan = float("nan")
+    count, mean, m2, down_m2, min_ratio = _risk_moments(
+        returns.to_numpy(dtype=np.float64), prices.to_numpy(dtype=np.float64), risk_free
+    )
+    ann = _annualizer(periods_per_year)
+    sharpe = sortino = nan
+    if count:
+        excess_mean = mean - risk_free
+        std = math.sqrt(m2 / count)
+        down = math.sqrt(down_m2 / count)
+        sharpe = excess_mean / std * ann if std != 0 else nan
+        sortino = excess_mean / down * ann if down != 0 else nan
+    mdd = min_ratio - 1.0
+    calmar = mean * periods_per_year / abs(mdd) if mdd != 0 and not math.isnan(mdd) else nan
+    return {"sharpe": float(sharpe), "sortino": float(sortino), "max_drawdown": float(mdd), "calmar": float(calmar)}
+
+
+@njit(cache=True)
+def _risk_moments(r: np.ndarray, p: np.ndarray, risk_free: float) -> tuple:
+    # One pass over the returns (Welford mean/M2 of the returns and of the
+    # downside excess min(r - rf, 0)) and one over the prices (running peak,
+    # lowest price/peak), skipping NaNs. min_ratio is NaN without prices;
+    # mean is NaN without returns.
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    down_mean = 0.0
+    down_m2 = 0.0
+    for i in range(r.shape[0]):
+        v = r[i]
+        if np.isnan(v):
+            continue
+        count += 1
+        delta = v - mean
+        mean += delta / count
+        m2 += delta * (v - mean)
+        d = min(v - risk_free, 0.0)
+        delta = d - down_mean
+        down_mean += delta / count
+        down_m2 += delta * (d - down_mean)
+    if count == 0:
+        mean = np.nan
+    peak = np.nan
+    min_ratio = np.nan
+    for i in range(p.shape[0]):
+        v = p[i]
+        if np.isnan(v):
+            continue
+        if np.isnan(peak) or v > peak:
+            peak = v
+        ratio = v / peak
+        if np.isnan(ratio):  # 0/0 with a zero peak; np.min would propagate it
+            return count, mean, m2, down_m2, np.nan
+        if np.isnan(min_ratio) or ratio < min_ratio:
+            min_ratio = ratio
+    return count, mean, m2, down_m2, min_ratio
+
+
 def rolling_risk_metrics(returns: pd.Series, window: int = 30) -> pd.DataFrame:
     """Rolling Sharpe and volatility."""
 
-    roll_vol = returns.rolling(window).std() * np.sqrt(365)
-    roll_mean = returns.rolling(window).mean()
-    roll_sharpe = (roll_mean / returns.rolling(window).std()) * np.sqrt(365)
-    return pd.DataFrame({"roll_vol": roll_vol, "roll_sharpe": roll_sharpe})
+    if NUMBA_AVAILABLE:
+        mean_arr, std_arr = _rolling_mean_std(returns.to_numpy(dtype=np.float64), window)
+    else:
+        r = returns.rolling(window)
+        # copy=True: under Copy-on-Write to_numpy() hands back read-only views
+        std_arr = r.std().to_numpy(copy=True)
+        mean_arr = r.mean().to_numpy(copy=True)
+    # Scale in place: on long (e.g. intraday) series every extra full-length
+    # temporary is another pass over memory. The mean buffer becomes the
+    # Sharpe column and the std buffer the vol column.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        np.divide(mean_arr, std_arr, out=mean_arr)
+    mean_arr *= _SQRT_365
+    std_arr *= _SQRT_365
+    return pd.DataFrame({"roll_vol": std_arr, "roll_sharpe": mean_arr}, index=returns.index, copy=False)
+
+
+@njit(cache=True)
+def _rolling_mean_std(x: np.ndarray, window: int) -> tuple:
+    # Rolling mean and sample std (min_periods=window) in one pass, using the
+    # same add/remove Welford updates as pandas' rolling var so results agree
+    # to rounding, including NaN gaps and exactly-constant windows (std 0).
+    # Like pandas, +/-inf counts as missing rather than entering the sums.
+    n = x.shape[0]
+    mean_out = np.full(n, np.nan)
+    std_out = np.full(n, np.nan)
+    nobs = 0
+    mean = 0.0
+    ssqdm = 0.0
+    prev = np.nan
+    same = 0
+    for i in range(n):
+        v = x[i]
+        if np.isfinite(v):
+            nobs += 1
+            delta = v - mean
+            mean += delta / nobs
+            ssqdm += delta * (v - mean)
+            same = same + 1 if v == prev else 1
+            prev = v
+        if i >= window:
+            u = x[i - window]
+            if np.isfinite(u):
+                nobs -= 1
+                if nobs:
+                    delta = u - mean
+                    mean -= delta / nobs
+                    ssqdm -= delta * (u - mean)
+                else:
+                    mean = 0.0
+                    ssqdm = 0.0
+        if nobs >= window and nobs > 1:
+            if same >= nobs:
+                mean_out[i] = prev
+                std_out[i] = 0.0
+            else:
+                mean_out[i] = mean
+                std_out[i] = np.sqrt(max(ssqdm, 0.0) / (nobs - 1))
+    return mean_out, std_out
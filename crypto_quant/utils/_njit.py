@@ -0,0 +1,29 @@
+"""Optional numba JIT helpers.
+
+Numerical kernels are decorated with :func:`njit` from here rather than from
+numba directly, so the package still imports (and runs the same code as plain
+Python) when numba is not installed.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+try:
+    from numba import njit, prange  # type: ignore
+
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; kernels run as plain Python
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args: Any, **kwargs: Any) -> Callable[..., Any]:
+        """No-op stand-in for ``numba.njit`` supporting both decorator forms."""
+
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+            return fn
+
+        return decorator
+
@@ -0,0 +1,116 @@
+"""TTL response cache for slow-changing data fetchers.
+
+Results are kept in memory for the life of the process and pickled to disk so
+warm runs (or a restarted API server) skip the network entirely. Empty or
+failed results are never cached, so a transient outage is retried next call.
+"""
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+import threading
+import time
+from typing import Any, Callable, Dict, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .config import project_root
+
+
+CACHE_DIR = os.getenv("CRYPTO_QUANT_CACHE_DIR") or os.path.join(project_root(), ".cache", "quant")
+
+_MISS = object()
+
+
+def _make_key(name: str, args: tuple, kwargs: dict) -> str:
+    raw = repr((name, args, sorted(kwargs.items()))).encode("utf-8")
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _is_empty(value: Any) -> bool:
+    if value is None:
+        return True
+    if isinstance(value, pd.DataFrame):
+        return value.empty
+    if isinstance(value, float):
+        return bool(np.isnan(value))
+    return False
+
+
+def _copy(value: Any) -> Any:
+    # Callers are free to mutate returned frames; keep the cached one pristine.
+    return value.copy() if isinstance(value, pd.DataFrame) else value
+
+
+def _read_disk(path: str, ttl: float) -> Tuple[Any, float]:
+    try:
+        mtime = os.path.getmtime(path)
+        if time.time() - mtime >= ttl:
+            return _MISS, 0.0
+        with open(path, "rb") as f:
+            return pickle.load(f), mtime
+    except Exception:
+        return _MISS, 0.0
+
+
+def _write_disk(path: str, value: Any) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+    except Exception:
+        pass
+
+
+def cached(ttl: float = 3600.0) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Cache a function's result in memory and on disk for ``ttl`` seconds.
+
+    Keys are built from the function's qualified name and its (hashable,
+    repr-stable) arguments.
+
+    Args:
+        ttl (float): Time-to-live in seconds.
+
+    Returns:
+        Callable: Decorator.
+    """
+
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        name = f"{fn.__module__}.{fn.__qualname__}"
+        memory: Dict[str, Tuple[float, Any]] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = _make_key(name, args, kwargs)
+            now = time.time()
+            with lock:
+                hit = memory.get(key)
+            if hit is not None and now - hit[0] < ttl:
+                return _copy(hit[1])
+
+            path = os.path.join(CACHE_DIR, f"{key}.pkl")
+            value, stamp = _read_disk(path, ttl)
+            if value is _MISS:
+                value = fn(*args, **kwargs)
+                if _is_empty(value):
+                    return value
+                stamp = now
+                _write_disk(path, value)
+            with lock:
+                memory[key] = (stamp, value)
+            return _copy(value)
+
+        def cache_clear() -> None:
+            with lock:
+                memory.clear()
+
+        wrapper.cache_clear = cache_clear  # type: ignore[attr-defined]
+        return wrapper
+
+    return decorator
@@ -5,6 +5,7 @@ used across the project.
 """
 from __future__ import annotations
 
+import functools
 import os
 import random
 from dataclasses import dataclass
@@ -12,7 +13,7 @@ from dataclasses import dataclass
 import numpy as np
 
 
-@dataclass
+@dataclass(frozen=True)
 class APIKeys:
     """Holds API keys loaded from environment variables."""
 
@@ -20,9 +21,13 @@ class APIKeys:
     fred: str | None
 
 
+@functools.lru_cache(maxsize=1)
 def get_api_keys() -> APIKeys:
     """Load API keys from environment variables.
 
+    The keys are read once and cached; call ``get_api_keys.cache_clear()``
+    after changing the environment to pick up new values.
+
     Returns:
         APIKeys: Dataclass with optional keys.
     """
@@ -45,15 +50,17 @@ def set_seed(seed: int = 42) -> None:
     try:
         import torch  # type: ignore
 
+        # also seeds every CUDA device (lazily), so no cuda.is_available() probe
         torch.manual_seed(seed)
-        if torch.cuda.is_available():
-            torch.cuda.manual_seed_all(seed)
     except Exception:
         # PyTorch is optional at import-time in many modules
         pass
 
 
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+
 def project_root() -> str:
     """Return absolute path to project root (directory containing this package)."""
 
-    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+    return _PROJECT_ROOT
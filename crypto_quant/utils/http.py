@@ -0,0 +1,54 @@
+"""Shared HTTP session for data fetchers.
+
+A single pooled ``requests.Session`` keeps connections alive across calls so
+repeated hits to the same host (e.g. several Binance endpoints per run) reuse
+TCP/TLS connections instead of handshaking every time.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # orjson is optional; fall back to the stdlib decoder
+    orjson = None
+
+
+USER_AGENT = "crypto-quant/1.0"
+
+
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=retry)
+    session.mount("https://", adapter)
+    session.headers.update({"User-Agent": USER_AGENT})
+    return session
+
+
+_SESSION = _build_session()
+
+
+def get_json(url: str, timeout: float = 15) -> Any:
+    """GET a URL through the shared session and decode its JSON body.
+
+    Args:
+        url (str): Fully-qualified URL including query string.
+        timeout (float): Request timeout in seconds.
+
+    Returns:
+        Any: Decoded JSON payload.
+
+    Raises:
+        requests.RequestException: On network or HTTP errors.
+    """
+
+    resp = _SESSION.get(url, timeout=timeout)
+    resp.raise_for_status()
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
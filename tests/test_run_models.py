@@ -0,0 +1,39 @@
+"""run_models must let the interpreter exit when models run in threads."""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import textwrap
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = textwrap.dedent(
+    """
+    import numpy as np
+    import pandas as pd
+
+    from crypto_quant.main import compute_indicators, run_models
+
+    rng = np.random.default_rng(0)
+    close = 30_000 * np.exp(np.cumsum(rng.normal(0, 0.03, 400)))
+    df = pd.DataFrame({"date": pd.date_range("2022-01-01", periods=400, tz="UTC"), "close": close})
+    models = run_models(compute_indicators(df))
+    print(sorted(models))
+    """
+)
+
+
+def test_parallel_run_models_exits() -> None:
+    env = dict(os.environ, CRYPTO_QUANT_PARALLEL_MODELS="1")
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (ROOT, env.get("PYTHONPATH")) if p)
+    proc = subprocess.run(
+        [sys.executable, "-c", SCRIPT],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=150,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert "'mc'" in proc.stdout